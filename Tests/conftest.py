@@ -1,7 +1,24 @@
 # remote_desktop_final/tests/conftest.py
+import os
 import pathlib
 import sys
 
+import pytest
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for the whole run.
+
+    Qt objects cached at module level (icons, validators) are owned by the
+    application; a per-module instance would take them with it on teardown.
+    """
+    from PyQt5.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,167 @@
+"""tests/test_chat_area.py
+=========================
+Behaviour of *client.widgets.chat_widget*: bubble markup and direction,
+batching, the bubble cap, theming and keeping the newest message in view.
+
+Runs on Qt's offscreen platform; nothing is shown on screen.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEventLoop, Qt, QTimer  # noqa: E402
+from PyQt5.QtGui import QTextDocument  # noqa: E402
+
+from client.widgets import chat_widget  # noqa: E402
+from client.widgets.chat_widget import ChatAreaWidget, ChatBubble  # noqa: E402
+
+
+@pytest.fixture
+def chat(qapp):
+    area = ChatAreaWidget()
+    area.resize(300, 400)
+    area.show()
+    _pump()
+    yield area
+    area.deleteLater()
+
+
+def _pump(ms: int = 100) -> None:
+    """Run the event loop long enough for flushes and layout passes."""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+def _at_bottom(area) -> bool:
+    bar = area.verticalScrollBar()
+    return bar.value() == bar.maximum()
+
+
+def _post(area, n: int, start: int = 0) -> None:
+    for i in range(start, start + n):
+        area.append_message("alice", f"message {i}", "12:00:00", i % 2 == 0)
+
+
+# ---------------------------------------------------------------------------
+# Bubbles
+# ---------------------------------------------------------------------------
+
+
+def test_bubble_keeps_sender_and_timestamp_hierarchy(qapp):
+    bubble = ChatBubble("alice", "hello", "12:00:00", True, "dark")
+
+    assert bubble.textFormat() == Qt.RichText
+    assert "<b>alice</b>" in bubble.text()
+    assert "<small" in bubble.text() and "12:00:00</small>" in bubble.text()
+
+
+def test_bubble_shows_peer_markup_verbatim(qapp):
+    message = "1 < 2 & <b>bold?</b>\nline 2"
+    bubble = ChatBubble("<i>eve</i>", message, "t", False, "light")
+
+    doc = QTextDocument()
+    doc.setHtml(bubble.text())
+    assert doc.toPlainText() == "<i>eve</i>\n1 < 2 & <b>bold?</b>\nline 2\nt"
+
+
+@pytest.mark.parametrize(
+    "message, rtl",
+    [
+        ("سلام دنیا", True),  # Persian
+        ("مرحبا", True),  # Arabic
+        ("؀", True),  # U+0600, first code point of the block
+        ("ۿ", True),  # U+06FF, last code point of the block
+        ("hello سلام", False),  # direction follows the first character
+        ("ݐ", False),  # U+0750, Arabic Supplement: outside the checked block
+        ("", False),
+    ],
+)
+def test_bubble_direction_follows_first_character(qapp, message, rtl):
+    bubble = ChatBubble("alice", message, "t", False, "dark")
+
+    assert chat_widget._is_rtl(message) is rtl
+    assert bubble.property("rtl") is rtl
+    assert bubble.layoutDirection() == (Qt.RightToLeft if rtl else Qt.LeftToRight)
+
+
+# ---------------------------------------------------------------------------
+# Batching and theming
+# ---------------------------------------------------------------------------
+
+
+def test_messages_are_added_in_one_batch(chat):
+    _post(chat, 5)
+    assert not chat._bubbles  # nothing is built until the flush
+
+    _pump()
+
+    assert [b.message for b in chat._bubbles] == [f"message {i}" for i in range(5)]
+
+
+def test_theme_switch_restyles_the_container_only(chat):
+    _post(chat, 3)
+    _pump()
+    bubble_sheets = [b.styleSheet() for b in chat._bubbles]
+
+    chat.update_theme("light")
+
+    assert chat.container.styleSheet() == chat_widget._CHAT_QSS["light"]
+    assert [b.styleSheet() for b in chat._bubbles] == bubble_sheets
+    assert all(b.theme == "light" for b in chat._bubbles)
+
+    _post(chat, 1, start=3)
+    _pump()
+    assert chat._bubbles[-1].theme == "light"
+
+
+# ---------------------------------------------------------------------------
+# Scrolling
+# ---------------------------------------------------------------------------
+
+
+def test_short_content_leaves_no_pending_scroll(chat):
+    _post(chat, 1)
+    _pump()
+
+    assert chat.verticalScrollBar().maximum() == 0
+    assert not chat._scroll_pending
+
+
+def test_new_messages_scroll_into_view(chat):
+    _post(chat, 40)
+    _pump()
+    assert chat.verticalScrollBar().maximum() > 0
+    assert _at_bottom(chat)
+
+    chat.verticalScrollBar().setValue(0)
+    _post(chat, 1, start=40)
+    _pump()
+
+    assert _at_bottom(chat)
+    assert not chat._scroll_pending
+
+
+def test_capped_history_still_scrolls(qapp, monkeypatch):
+    monkeypatch.setattr(chat_widget, "_MAX_BUBBLES", 30)
+    area = ChatAreaWidget()
+    area.resize(300, 400)
+    area.show()
+    _post(area, 40)
+    _pump()
+    assert len(area._bubbles) == 30
+
+    # Same-sized bubble in, same-sized bubble out: the range does not move
+    area.verticalScrollBar().setValue(0)
+    _post(area, 2, start=40)
+    _pump()
+
+    assert len(area._bubbles) == 30
+    assert _at_bottom(area)
+    assert not area._scroll_pending
+    area.deleteLater()
@@ -0,0 +1,276 @@
+"""tests/test_controller_window.py
+=================================
+Input forwarding in *client.ui_controller.ControllerWindow*: which handlers
+are wired for a session, what the screen view lets through, mouse-move
+throttling, the status bar and closing the window.
+
+Runs on Qt's offscreen platform; events are fed straight to the screen view.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import (  # noqa: E402
+    QCoreApplication,
+    QEvent,
+    QEventLoop,
+    QPoint,
+    QPointF,
+    Qt,
+    QTimer,
+)
+from PyQt5.QtGui import QKeyEvent, QMouseEvent, QPixmap, QWheelEvent  # noqa: E402
+
+from client import ui_controller  # noqa: E402
+from client.ui_controller import ControllerWindow  # noqa: E402
+
+_ALL = {"view": True, "mouse": True, "keyboard": True}
+
+
+@pytest.fixture
+def window(qapp):
+    win = ControllerWindow(username="alice", user_id=1, role="controller")
+    sent = []
+    win.input_event_generated.connect(sent.append)
+    label = win.screen_label
+    label.resize(100, 100)
+    label.setPixmap(QPixmap(100, 100))
+    yield win, sent
+    win.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def _start_session(win, permissions=_ALL) -> None:
+    win.update_peer_status(True, "bob", 7)
+    win.set_active_permissions(permissions)
+
+
+def _pump(ms: int) -> None:
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+def _move(x: int, y: int) -> QMouseEvent:
+    return QMouseEvent(
+        QEvent.MouseMove, QPointF(x, y), Qt.NoButton, Qt.NoButton, Qt.NoModifier
+    )
+
+
+def _press(x: int, y: int) -> QMouseEvent:
+    return QMouseEvent(
+        QEvent.MouseButtonPress,
+        QPointF(x, y),
+        Qt.LeftButton,
+        Qt.LeftButton,
+        Qt.NoModifier,
+    )
+
+
+def _key(auto_repeat: bool) -> QKeyEvent:
+    return QKeyEvent(QEvent.KeyPress, Qt.Key_A, Qt.NoModifier, "a", auto_repeat)
+
+
+# ---------------------------------------------------------------------------
+# Handler wiring
+# ---------------------------------------------------------------------------
+
+
+def test_nothing_forwarded_outside_a_session(window):
+    win, sent = window
+    win.set_active_permissions(_ALL)  # granted, but no peer yet
+
+    win.screen_label.keyPressEvent(_key(False))
+    win.screen_label.mousePressEvent(_press(10, 10))
+
+    assert sent == []
+    assert not win.screen_label.hasMouseTracking()
+
+
+def test_handlers_follow_permissions(window):
+    win, sent = window
+    _start_session(win, {"view": True, "mouse": False, "keyboard": True})
+    assert not win.screen_label.hasMouseTracking()
+
+    win.screen_label.keyPressEvent(_key(False))
+    win.screen_label.mousePressEvent(_press(10, 10))
+    assert [e["type"] for e in sent] == ["keypress"]
+
+    win.set_active_permissions({"view": True, "mouse": True, "keyboard": False})
+    assert win.screen_label.hasMouseTracking()
+    win.screen_label.keyPressEvent(_key(False))
+    win.screen_label.mousePressEvent(_press(10, 10))
+    assert [e["type"] for e in sent] == ["keypress", "mousepress"]
+
+
+def test_repeat_grants_connect_each_handler_once(window):
+    win, sent = window
+    _start_session(win)
+    win.set_active_permissions(_ALL)
+
+    win.screen_label.keyPressEvent(_key(False))
+
+    assert len(sent) == 1
+
+
+def test_session_end_disconnects_handlers(window):
+    win, sent = window
+    _start_session(win)
+
+    win.update_peer_status(False)
+    win.screen_label.keyPressEvent(_key(False))
+
+    assert sent == []
+    assert not win.screen_label.hasMouseTracking()
+
+
+# ---------------------------------------------------------------------------
+# Screen view
+# ---------------------------------------------------------------------------
+
+
+def test_auto_repeat_stops_at_the_screen_view(window):
+    win, sent = window
+    _start_session(win)
+
+    win.screen_label.keyPressEvent(_key(True))
+    win.screen_label.keyPressEvent(_key(False))
+
+    assert len(sent) == 1
+    assert win.screen_label.testAttribute(Qt.WA_KeyCompression)
+
+
+def test_wheel_sends_raw_angle_delta(window):
+    win, sent = window
+    _start_session(win)
+    event = QWheelEvent(
+        QPointF(10, 10),
+        QPointF(10, 10),
+        QPoint(),
+        QPoint(0, -40),
+        Qt.NoButton,
+        Qt.NoModifier,
+        Qt.NoScrollPhase,
+        False,
+    )
+
+    win.screen_label.wheelEvent(event)
+
+    assert sent == [{"type": "wheel", "dx": 0, "dy": -40, "mods": 0}]
+
+
+def test_status_text_is_set_only_when_it_changes(window, monkeypatch):
+    win, _ = window
+    label = win.screen_label
+    calls = []
+    monkeypatch.setattr(label, "setText", calls.append)
+
+    label.show_text("Waiting for frames")
+    label.show_text("Waiting for frames")
+    label.setPixmap(QPixmap(100, 100))  # the text is gone once a frame shows
+    label.show_text("Waiting for frames")
+
+    assert calls == ["Waiting for frames", "Waiting for frames"]
+
+
+# ---------------------------------------------------------------------------
+# Mouse-move throttling
+# ---------------------------------------------------------------------------
+
+
+def test_rtt_sets_the_move_interval_within_bounds(window):
+    win, _ = window
+
+    win.set_network_rtt(50)
+    assert win._move_interval_ms == 50
+    win.set_network_rtt(0)
+    assert win._move_interval_ms == ui_controller._MOVE_INTERVAL_MIN_MS
+    win.set_network_rtt(5000)
+    assert win._move_interval_ms == ui_controller._MOVE_INTERVAL_MAX_MS
+
+
+def test_moves_within_an_interval_collapse_to_the_latest(window):
+    win, sent = window
+    _start_session(win)
+    win.set_network_rtt(50)
+
+    for x in (10, 20, 30):
+        win.screen_label.mouseMoveEvent(_move(x, 10))
+    assert [e["x"] for e in sent] == [10]
+
+    _pump(120)
+
+    assert [e["x"] for e in sent] == [10, 30]
+
+
+def test_held_back_move_goes_out_before_a_click(window):
+    win, sent = window
+    _start_session(win)
+    win.set_network_rtt(ui_controller._MOVE_INTERVAL_MAX_MS)
+
+    win.screen_label.mouseMoveEvent(_move(10, 10))
+    win.screen_label.mouseMoveEvent(_move(40, 10))
+    win.screen_label.mousePressEvent(_press(50, 10))
+
+    assert [(e["type"], e["x"]) for e in sent] == [
+        ("mousemove", 10),
+        ("mousemove", 40),
+        ("mousepress", 50),
+    ]
+    assert not win._move_flush_timer.isActive()
+
+
+# ---------------------------------------------------------------------------
+# Showing and closing
+# ---------------------------------------------------------------------------
+
+
+def test_status_timers_start_when_shown(window):
+    win, _ = window
+    assert not win._timer.isActive()
+    assert not win._bandwidth_timer.isActive()
+
+    win.show()
+
+    assert win._timer.isActive()
+    assert win._bandwidth_timer.isActive()
+    win.hide()
+
+
+def test_session_clock_skips_hidden_updates(window):
+    win, _ = window
+    label = win.session_timer_label
+    win.update_peer_status(True, "bob", 7)
+    label.setText("unchanged")
+
+    win._update_session_timer()  # hidden: clock runs, label left alone
+    assert win._session_elapsed.isValid()
+    assert label.text() == "unchanged"
+
+    win.show()
+    win._update_session_timer()
+    assert label.text() == "Session: 00:00:00"
+
+    win.update_peer_status(False)
+    win._update_session_timer()
+    assert label.text() == "Session: --:--:--"
+    assert not win._session_elapsed.isValid()
+    win.hide()
+
+
+def test_close_requests_logout_after_the_window_closes(window):
+    win, _ = window
+    seen = []
+    win.logout_signal.connect(lambda: seen.append(win.isVisible()))
+    win.show()
+
+    win.close()
+    assert seen == []
+
+    _pump(0)
+    assert seen == [False]
@@ -0,0 +1,46 @@
+"""tests/test_login_address.py
+==============================
+The dotted-quad check behind the login form's server-address validation.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from client.ui_login import _is_ipv4  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "addr",
+    ["0.0.0.0", "127.0.0.1", "192.168.1.10", "255.255.255.255", "10.0.100.9"],
+)
+def test_valid_ipv4(addr):
+    assert _is_ipv4(addr)
+
+
+@pytest.mark.parametrize(
+    "addr",
+    [
+        "",
+        "256.1.1.1",  # octet out of range
+        "1.2.3.999",
+        "1..2.3",  # empty octet
+        ".1.2.3",
+        "1.2.3.",
+        "1.2.3",  # too few octets
+        "1.2.3.4.5",  # too many
+        " 1.2.3.4",  # surrounding whitespace
+        "1.2.3.4 ",
+        "1.2.3.4a",
+        "1234.1.1.1",
+        "192.168.001.1",  # leading zeros read as octal by inet_aton
+        "01.2.3.4",
+        "1.2.3.00",
+    ],
+)
+def test_invalid_ipv4(addr):
+    assert not _is_ipv4(addr)
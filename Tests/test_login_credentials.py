@@ -0,0 +1,202 @@
+"""tests/test_login_credentials.py
+=================================
+Saved-login storage of *client.ui_login*: the on-disk account list, its
+conversion from the old single-account layout, and the keyring hand-off.
+
+Every test runs in its own temporary working directory, so the project's
+own ``credentials.json`` is never read or touched.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import types
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+from PyQt5.QtCore import QCoreApplication, QEvent  # noqa: E402
+
+from client import ui_login  # noqa: E402
+from client.ui_login import LoginWindow, _Creds  # noqa: E402
+
+
+class _FakeKeyring:
+    """In-memory stand-in for the ``keyring`` module."""
+
+    errors = types.SimpleNamespace(KeyringError=RuntimeError)
+
+    def __init__(self) -> None:
+        self.store: dict[tuple[str, str], str] = {}
+
+    def set_password(self, service: str, user: str, pwd: str) -> None:
+        self.store[(service, user)] = pwd
+
+    def get_password(self, service: str, user: str) -> str | None:
+        return self.store.get((service, user))
+
+    def delete_password(self, service: str, user: str) -> None:
+        self.store.pop((service, user), None)
+
+
+@pytest.fixture
+def keyring(monkeypatch):
+    kr = _FakeKeyring()
+    monkeypatch.setattr(ui_login, "_keyring", kr)
+    return kr
+
+
+@pytest.fixture(autouse=True)
+def cred_dir(monkeypatch, tmp_path):
+    """Fresh cwd and an empty credentials cache for every test."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(LoginWindow, "_cred_cache", None)
+    monkeypatch.setattr(LoginWindow, "_cred_cache_bytes", None)
+    return tmp_path
+
+
+@pytest.fixture
+def window(qapp, keyring):
+    win = LoginWindow(with_role=True)
+    yield win
+    # Delete now: its deferred credentials load must not run after the test
+    # has left the temporary directory
+    win.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def _login(win, user: str, role: str = "controller", remember: bool = True) -> None:
+    creds = _Creds("127.0.0.1", "9009", user, user + "-pw", role, remember)
+    win._save_credentials(creds)
+
+
+def _on_disk(cred_dir) -> dict:
+    return json.loads((cred_dir / ui_login._CREDENTIALS_FILE).read_text())
+
+
+# ---------------------------------------------------------------------------
+# Old-layout migration
+# ---------------------------------------------------------------------------
+
+
+def test_old_layout_password_moves_to_keyring(cred_dir, keyring):
+    (cred_dir / ui_login._CREDENTIALS_FILE).write_text(
+        json.dumps(
+            {"username": "mmd", "password": "1", "role": "target", "remember_me": True}
+        )
+    )
+
+    data = LoginWindow._read_credentials()
+
+    assert data == {"users": ["mmd"], "roles": ["target"], "last_idx": 0}
+    assert keyring.get_password(ui_login._KEYRING_SERVICE, "mmd") == "1"
+    on_disk = _on_disk(cred_dir)
+    assert "password" not in on_disk
+    assert on_disk == data
+
+
+def test_old_layout_password_dropped_without_keyring(cred_dir, monkeypatch):
+    monkeypatch.setattr(ui_login, "_keyring", False)
+    (cred_dir / ui_login._CREDENTIALS_FILE).write_text(
+        json.dumps({"username": "mmd", "password": "1", "remember_me": True})
+    )
+
+    LoginWindow._read_credentials()
+
+    assert "password" not in _on_disk(cred_dir)
+
+
+def test_old_layout_not_remembered_is_removed(cred_dir, keyring):
+    path = cred_dir / ui_login._CREDENTIALS_FILE
+    path.write_text(json.dumps({"username": "mmd", "password": "1"}))
+
+    assert LoginWindow._read_credentials()["users"] == []
+    assert not path.exists()
+    assert keyring.store == {}
+
+
+# ---------------------------------------------------------------------------
+# Account list
+# ---------------------------------------------------------------------------
+
+
+def test_old_layout_converts_to_account_list():
+    data = ui_login._normalize_credentials(
+        {"username": "mmd", "role": "target", "remember_me": True}
+    )
+    assert data == {"users": ["mmd"], "roles": ["target"], "last_idx": 0}
+    assert ui_login._normalize_credentials({"username": "mmd"})["users"] == []
+
+
+def test_second_account_is_added(cred_dir, window, keyring):
+    _login(window, "alice")
+    _login(window, "bob", role="target")
+
+    assert _on_disk(cred_dir) == {
+        "users": ["alice", "bob"],
+        "roles": ["controller", "target"],
+        "last_idx": 1,
+    }
+    assert keyring.get_password(ui_login._KEYRING_SERVICE, "bob") == "bob-pw"
+
+
+def test_last_idx_follows_latest_login(cred_dir, window):
+    _login(window, "alice")
+    _login(window, "bob")
+    _login(window, "alice", role="target")
+
+    data = _on_disk(cred_dir)
+    assert data["users"] == ["alice", "bob"]  # no duplicate entry
+    assert data["roles"][0] == "target"
+    assert data["last_idx"] == 0
+
+
+def test_forgetting_one_account_keeps_the_rest(cred_dir, window, keyring):
+    _login(window, "alice")
+    _login(window, "bob")
+    _login(window, "alice", remember=False)
+
+    assert _on_disk(cred_dir) == {
+        "users": ["bob"],
+        "roles": ["controller"],
+        "last_idx": -1,
+    }
+    assert keyring.get_password(ui_login._KEYRING_SERVICE, "alice") is None
+    assert keyring.get_password(ui_login._KEYRING_SERVICE, "bob") == "bob-pw"
+
+
+def test_file_removed_when_last_account_forgotten(cred_dir, window):
+    _login(window, "alice")
+    assert (cred_dir / ui_login._CREDENTIALS_FILE).exists()
+
+    _login(window, "alice", remember=False)
+
+    assert not (cred_dir / ui_login._CREDENTIALS_FILE).exists()
+    assert LoginWindow._read_credentials()["users"] == []
+
+
+# ---------------------------------------------------------------------------
+# File safety
+# ---------------------------------------------------------------------------
+
+
+def test_saved_file_is_owner_only(cred_dir, window):
+    _login(window, "alice")
+
+    mode = (cred_dir / ui_login._CREDENTIALS_FILE).stat().st_mode & 0o777
+    assert mode == 0o600
+    assert not list(cred_dir.glob(".cred.*"))  # temp file swapped in, not left
+
+
+@pytest.mark.skipif(not hasattr(os, "O_NOFOLLOW"), reason="needs O_NOFOLLOW")
+def test_symlinked_file_is_refused(cred_dir, tmp_path_factory):
+    planted = tmp_path_factory.mktemp("elsewhere") / "creds.json"
+    planted.write_text(
+        json.dumps({"users": ["mallory"], "roles": ["controller"], "last_idx": 0})
+    )
+    (cred_dir / ui_login._CREDENTIALS_FILE).symlink_to(planted)
+
+    assert LoginWindow._read_credentials()["users"] == []
@@ -0,0 +1,157 @@
+"""tests/test_login_form.py
+==========================
+Reading and checking the login form in *client.ui_login*: which error a
+bad form reports, port validation, the role sent with a login and the
+password visibility toggle.
+
+Each test runs in a temporary working directory, so the deferred load of
+saved credentials never reads the project's ``credentials.json``.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QCoreApplication, QEvent  # noqa: E402
+from PyQt5.QtTest import QTest  # noqa: E402
+from PyQt5.QtWidgets import QLineEdit  # noqa: E402
+
+from client.ui_login import LoginWindow  # noqa: E402
+
+
+@pytest.fixture
+def login(qapp, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(LoginWindow, "_cred_cache", None)
+    monkeypatch.setattr(LoginWindow, "_cred_cache_bytes", None)
+    win = LoginWindow(with_role=True)
+    win.remember_chk.setChecked(False)
+    sent = []
+    win.login_attempt_signal.connect(lambda *a: sent.append(a))
+    yield win, sent
+    _destroy(win)
+
+
+def _destroy(win) -> None:
+    """Delete now, so the deferred credentials load never fires elsewhere."""
+    win.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def _fill(win, ip="127.0.0.1", port="9009", user="alice", pwd="pw") -> None:
+    win.ip_in.setText(ip)
+    win.port_in.setText(port)
+    win.user_in.setText(user)
+    win.pass_in.setText(pwd)
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "fields, error",
+    [
+        ({"ip": ""}, "Server IP / hostname required."),
+        ({"ip": "", "user": ""}, "Server IP / hostname required."),
+        ({"port": ""}, "Port must be 1-65535."),
+        ({"port": "0"}, "Port must be 1-65535."),
+        ({"port": "70000"}, "Port must be 1-65535."),
+        ({"user": "   "}, "Username required."),
+        # Empty fields are reported before a malformed address
+        ({"ip": "999.1.1.1", "user": ""}, "Username required."),
+        ({"ip": "999.1.1.1"}, "Invalid IP / hostname."),
+        ({"ip": "server"}, "Invalid IP / hostname."),
+    ],
+)
+def test_bad_form_reports_first_error(login, fields, error):
+    win, sent = login
+    _fill(win, **fields)
+
+    win._on_login()
+
+    assert sent == []
+    assert win.err_lbl.text() == error
+
+
+@pytest.mark.parametrize("ip", ["127.0.0.1", "relay.example.com"])
+def test_good_form_is_sent(login, ip):
+    win, sent = login
+    _fill(win, ip=ip, user=" alice ")
+
+    win._on_login()
+
+    assert sent == [(f"{ip}:9009", "alice", "pw", "controller", False)]
+
+
+def test_port_field_rejects_non_digits(login):
+    win, _ = login
+    win.port_in.clear()
+
+    QTest.keyClicks(win.port_in, "80a")
+
+    assert win.port_in.text() == "80"
+
+
+def test_port_validator_shared_across_windows(login):
+    win, _ = login
+    other = LoginWindow()
+
+    assert other.port_in.validator() is win.port_in.validator()
+    _destroy(other)
+
+
+# ---------------------------------------------------------------------------
+# Role
+# ---------------------------------------------------------------------------
+
+
+def test_selected_role_is_sent(login):
+    win, sent = login
+    _fill(win)
+    win.role_combo.setCurrentText("Target")
+
+    win._on_login()
+
+    assert sent[0][3] == "target"
+
+
+def test_unknown_role_falls_back_to_controller(login):
+    win, _ = login
+    win.role_combo.addItem("Admin")
+    win.role_combo.setCurrentText("Admin")
+
+    assert win._snapshot().role == "controller"
+
+
+def test_role_picker_is_optional(qapp, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    win = LoginWindow()
+
+    assert win.role_combo is None
+    assert win._snapshot().role == ""
+    _destroy(win)
+
+
+# ---------------------------------------------------------------------------
+# Password field
+# ---------------------------------------------------------------------------
+
+
+def test_eye_action_toggles_password_visibility(login):
+    win, _ = login
+    field = win.pass_in
+    assert field.echoMode() == QLineEdit.Password
+
+    field._toggle_act.trigger()
+    assert field.echoMode() == QLineEdit.Normal
+    assert field._toggle_act.toolTip() == "Hide password"
+
+    field._toggle_act.trigger()
+    assert field.echoMode() == QLineEdit.Password
+    assert field._toggle_act.toolTip() == "Show password"
@@ -101,3 +101,51 @@ def test_image_roundtrip(tmp_path):
     for x, y in [(0, 0), (50, 25), (99, 49)]:
         r, g, b = decoded.getpixel((x, y))
         assert r > 200 and g < 50 and b < 50, "decoded image not predominantly red"
+
+
+def test_input_packet_is_compact():
+    """INPUT payloads carry no separator padding and survive a round‑trip."""
+    a, b = socket.socketpair()
+    event = {"type": "keypress", "key_code": 65, "text": "A", "mods": 0x3}
+    send_json(a, PacketType.INPUT, {"target_username": "bob", "input_event": event})
+
+    size = shared_protocol.HEADER_STRUCT.unpack(b.recv(4, socket.MSG_PEEK))[0]
+    raw = b.recv(4 + size, socket.MSG_PEEK)[4:]
+    ptype, data = recv(b)
+    a.close()
+    b.close()
+
+    assert b", " not in raw and b": " not in raw
+    assert ptype is PacketType.INPUT
+    assert data["input_event"] == event
+    assert data["input_event"]["mods"] & shared_protocol.MOD_SHIFT
+    assert data["input_event"]["mods"] & shared_protocol.MOD_CTRL
+
+
+def _feed_wheel(deltas, residual=0):
+    steps = []
+    for d in deltas:
+        n, residual = shared_protocol.wheel_steps(residual, d)
+        steps.append(n)
+    return steps, residual
+
+
+def test_wheel_whole_notches():
+    """A full WHEEL_DELTA (or a multiple) scrolls straight away."""
+    notch = shared_protocol.WHEEL_DELTA
+    assert shared_protocol.wheel_steps(0, notch) == (1, 0)
+    assert shared_protocol.wheel_steps(0, -2 * notch) == (-2, 0)
+
+
+def test_wheel_sub_notch_deltas_accumulate():
+    """Fractional deltas add up to one notch; the remainder is carried."""
+    assert _feed_wheel([40, 40, 40]) == ([0, 0, 1], 0)
+    assert _feed_wheel([100, 100]) == ([0, 1], 80)
+    assert _feed_wheel([-90, -90]) == ([0, -1], -60)
+    assert shared_protocol.wheel_steps(70, 0) == (0, 70)
+
+
+def test_wheel_sign_flip_resets_residual():
+    """Turning the wheel back drops what was left of the old direction."""
+    assert _feed_wheel([90, -60]) == ([0, 0], -60)
+    assert _feed_wheel([90, -60, -60]) == ([0, 0, -1], 0)
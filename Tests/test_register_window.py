@@ -0,0 +1,135 @@
+"""tests/test_register_window.py
+================================
+Registration window: the logo is loaded on first show and shared by later
+windows through QPixmapCache, and a submit stays single until it is answered.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QPixmapCache  # noqa: E402
+
+from client import ui_register  # noqa: E402
+from client.ui_register import RegistrationWindow  # noqa: E402
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def qapp(qapp, monkeypatch):
+    monkeypatch.chdir(ROOT)  # the logo path is relative to the project root
+    QPixmapCache.clear()
+    yield qapp
+    QPixmapCache.clear()
+
+
+def test_logo_loaded_on_first_show_only(qapp):
+    win = RegistrationWindow()
+    assert win.logo_lbl.pixmap() is None or win.logo_lbl.pixmap().isNull()
+
+    win.show()
+    pm = win.logo_lbl.pixmap()
+    assert pm is not None and not pm.isNull()
+    size = ui_register._LOGO_SIZE
+    assert pm.width() <= size and pm.height() <= size
+    win.close()
+    win.deleteLater()
+
+
+def test_later_windows_reuse_cached_logo(qapp):
+    first = RegistrationWindow()
+    first.show()
+    second = RegistrationWindow()
+    second.show()
+
+    assert (
+        first.logo_lbl.pixmap().cacheKey() == second.logo_lbl.pixmap().cacheKey()
+    )
+    for win in (first, second):
+        win.close()
+        win.deleteLater()
+
+
+# ---------------------------------------------------------------------------
+# Submitting
+# ---------------------------------------------------------------------------
+
+
+def _fill(win, usr: str, pwd: str, cpwd: str) -> None:
+    win.user_in.setText(usr)
+    win.pwd_in.setText(pwd)
+    win.cpwd_in.setText(cpwd)
+
+
+@pytest.fixture
+def form(qapp):
+    win = RegistrationWindow()
+    sent = []
+    win.register_attempt_signal.connect(lambda *a: sent.append(a))
+    yield win, sent
+    win.deleteLater()
+
+
+def test_repeat_submit_is_dropped_while_pending(form):
+    win, sent = form
+    _fill(win, " alice ", "pw", "pw")
+
+    win._on_register()
+    win._on_register()
+
+    assert sent == [("alice", "pw", "pw")]
+    assert not win.reg_btn.isEnabled()
+
+
+def test_error_ends_pending_submit(form):
+    win, sent = form
+    _fill(win, "alice", "pw", "pw")
+    win._on_register()
+
+    win._err("Username taken.")
+    win._on_register()
+
+    assert len(sent) == 2
+
+
+def test_reset_form_ends_pending_submit(form):
+    win, sent = form
+    _fill(win, "alice", "pw", "pw")
+    win._on_register()
+    win.reset_form()
+
+    _fill(win, "bob", "pw", "pw")
+    win._on_register()
+
+    assert sent[-1] == ("bob", "pw", "pw")
+    assert not win.err_lbl.isVisibleTo(win)
+
+
+@pytest.mark.parametrize(
+    "pwd, cpwd",
+    [("secret", "secreT"), ("secret", "secret1"), ("pässwörd", "passwort")],
+)
+def test_mismatched_passwords_are_rejected(form, pwd, cpwd):
+    win, sent = form
+    _fill(win, "alice", pwd, cpwd)
+
+    win._on_register()
+
+    assert sent == []
+    assert win.err_lbl.text() == "Passwords do not match."
+    assert win.reg_btn.isEnabled()
+
+
+def test_non_ascii_matching_passwords_are_accepted(form):
+    win, sent = form
+    _fill(win, "alice", "رمز-عبور", "رمز-عبور")
+
+    win._on_register()
+
+    assert sent == [("alice", "رمز-عبور", "رمز-عبور")]
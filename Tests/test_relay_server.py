@@ -29,11 +29,6 @@ from typing import Tuple
 
 import pytest
 
-pytest.skip(
-    "pairing test relies on old server flow – will be rewritten after stream integration",
-    allow_module_level=True,
-)
-
 # ---------------------------------------------------------------------------
 # Locate project root so that "shared" and "relay_server" packages resolve
 # ---------------------------------------------------------------------------
@@ -63,7 +58,8 @@ recv = shared_protocol.recv
 PacketType = shared_protocol.PacketType  # noqa: N806
 
 relay_mod: ModuleType = importlib.import_module("relay_server.server")  # type: ignore
-RelayServer = relay_mod.RelayServer  # noqa: N806
+RelayServer = getattr(relay_mod, "RelayServer", None)  # noqa: N806 – old flow
+ClientConnection = relay_mod.ClientConnection
 
 
 # ---------------------------------------------------------------------------
@@ -101,6 +97,18 @@ def _connect_and_auth(
 # ---------------------------------------------------------------------------
 
 
+def _start_relay(monkeypatch, tmp_path):
+    """Starts the current relay on an ephemeral port with a scratch DB."""
+    scratch_db = relay_mod.Database(tmp_path / "relay.db")
+    monkeypatch.setattr(relay_mod, "db", scratch_db)
+    srv = relay_mod.CustomThreadingTCPServer(("127.0.0.1", 0), relay_mod.RelayHandler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, srv.server_address[1], scratch_db
+
+
+@pytest.mark.skip(
+    reason="pairing test relies on old server flow – will be rewritten after stream integration"
+)
 def test_pairing_flow():
     srv, port, th = _start_server()
 
@@ -121,3 +129,71 @@ def test_pairing_flow():
     target.close()
     srv.stop()  # Use new stop method instead of directly closing socket
     th.join(timeout=1)  # ensure listener thread exits cleanly
+
+
+def test_heartbeat_roundtrip(monkeypatch, tmp_path):
+    """The relay echoes HEARTBEAT payloads back to the sender unchanged."""
+    srv, port, scratch_db = _start_relay(monkeypatch, tmp_path)
+    scratch_db.register_user("alice", "xyz")
+    sock = _connect_and_auth("alice", "xyz", "controller", port)
+    sock.settimeout(2)
+    try:
+        send_json(sock, PacketType.HEARTBEAT, {"sent_at": 12.5})
+        ptype, data = recv(sock)
+    finally:
+        sock.close()
+        srv.shutdown()
+        srv.server_close()
+
+    assert ptype is PacketType.HEARTBEAT
+    assert data == {"sent_at": 12.5}
+
+
+def test_client_connection_sends_whole_packets():
+    """Concurrent FRAME and HEARTBEAT writes to one peer never interleave."""
+    a, b = socket.socketpair()
+    conn = ClientConnection(
+        sock=a,
+        addr=("127.0.0.1", 0),
+        username="alice",
+        user_id=1,
+        role="controller",
+        handler=None,
+    )
+    frame = bytes(range(256)) * 8192  # 2 MiB: sendall needs several send()s
+    rounds = 20
+    received: list = []
+
+    def _reader() -> None:
+        for _ in range(rounds * 2):
+            received.append(recv(b))
+
+    reader = threading.Thread(target=_reader, daemon=True)
+    reader.start()
+    writers = [
+        threading.Thread(
+            target=lambda: [
+                conn.send_bytes(PacketType.FRAME, frame) for _ in range(rounds)
+            ]
+        ),
+        threading.Thread(
+            target=lambda: [
+                conn.send_json(PacketType.HEARTBEAT, {"sent_at": 1.0})
+                for _ in range(rounds)
+            ]
+        ),
+    ]
+    for w in writers:
+        w.start()
+    for w in writers:
+        w.join(timeout=10)
+    reader.join(timeout=10)
+    a.close()
+    b.close()
+
+    assert len(received) == rounds * 2
+    frames = [d for p, d in received if p is PacketType.FRAME]
+    beats = [d for p, d in received if p is PacketType.HEARTBEAT]
+    assert len(frames) == len(beats) == rounds
+    assert all(d == frame for d in frames)
+    assert all(d == {"sent_at": 1.0} for d in beats)
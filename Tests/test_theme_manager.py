@@ -0,0 +1,85 @@
+"""tests/test_theme_manager.py
+=============================
+*client.theme_manager*: stylesheets are read from disk once per theme and
+an unchanged sheet is not applied again.
+
+Theme choices are saved to a temporary ``settings.json``, never the real one.
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import pathlib
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QWidget  # noqa: E402
+
+from client.theme_manager import ThemeManager  # noqa: E402
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    monkeypatch.chdir(ROOT)  # STYLES_DIR is relative to the project root
+    settings = str(tmp_path / "settings.json")
+    monkeypatch.setattr(ThemeManager, "SETTINGS_FILE", settings)
+    return ThemeManager()
+
+
+class _SheetCounter(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sets = 0
+
+    def setStyleSheet(self, sheet: str) -> None:  # noqa: N802 - Qt name
+        self.sets += 1
+        super().setStyleSheet(sheet)
+
+
+def test_stylesheet_read_once_per_theme(manager, monkeypatch):
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(path, *args, **kwargs):
+        if str(path).endswith(".qss"):
+            opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+
+    dark = manager._load_stylesheet_content("dark")
+    assert dark
+    assert manager._load_stylesheet_content("dark") is dark
+    manager._load_stylesheet_content("light")
+    manager._load_stylesheet_content("light")
+
+    assert len(opened) == 2
+
+
+def test_unchanged_sheet_is_not_reapplied(qapp, manager):
+    widget = _SheetCounter()
+
+    manager.apply_theme(widget, "dark")
+    manager.apply_theme(widget, "dark")
+    assert widget.sets == 1
+
+    manager.apply_theme(widget, "light")
+    assert widget.sets == 2
+    assert widget.styleSheet() == manager._load_stylesheet_content("light")
+
+
+def test_reapply_still_announces_the_theme(qapp, manager):
+    widget = QWidget()
+    seen = []
+    manager.theme_changed.connect(seen.append)
+
+    manager.apply_theme(widget, "light")
+    manager.apply_theme(widget, "light")
+
+    assert seen == ["light", "light"]
+    assert manager.get_current_theme() == "light"
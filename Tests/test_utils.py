@@ -0,0 +1,47 @@
+"""tests/test_utils.py
+=====================
+The per-second chat timestamp in *shared.utils*.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from shared import utils
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable ``time.time`` plus a count of ``localtime`` calls."""
+    now = [1_700_000_000.25]
+    calls = []
+    real_localtime = time.localtime
+
+    def fake_localtime(secs):
+        calls.append(secs)
+        return real_localtime(secs)
+
+    monkeypatch.setattr(utils, "_clock_cache", (-1, ""))
+    monkeypatch.setattr(utils.time, "time", lambda: now[0])
+    monkeypatch.setattr(utils.time, "localtime", fake_localtime)
+    return now, calls
+
+
+def test_clock_hms_matches_strftime(clock):
+    now, _ = clock
+    assert utils.clock_hms() == time.strftime("%H:%M:%S", time.localtime(now[0]))
+
+
+def test_clock_hms_formats_once_per_second(clock):
+    now, calls = clock
+
+    first = utils.clock_hms()
+    now[0] += 0.5
+    assert utils.clock_hms() == first
+    assert len(calls) == 1
+
+    now[0] += 1
+    assert utils.clock_hms() != first
+    assert len(calls) == 2
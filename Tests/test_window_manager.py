@@ -0,0 +1,319 @@
+"""tests/test_window_manager.py
+==============================
+Dialog handling in *client.window_manager*: the shared permission dialog
+and message boxes, their clean-up when a window goes away, and theme
+switching.
+
+Runs on Qt's offscreen platform; ``exec_`` is patched wherever a test would
+otherwise wait for a click.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import sip  # noqa: E402
+from PyQt5.QtCore import QCoreApplication, QEvent, QObject, pyqtSlot  # noqa: E402
+from PyQt5.QtWidgets import QDialog, QMessageBox, QWidget  # noqa: E402
+
+from client import ui_login, window_manager  # noqa: E402
+from client.ui_login import LoginWindow  # noqa: E402
+from client.window_manager import PermissionDialog, WindowManager  # noqa: E402
+
+
+class _Themes:
+    """Theme manager stand-in; the real one restyles the whole application."""
+
+    def __init__(self) -> None:
+        self.current = "dark"
+        self.applied: list[str] = []
+
+    def get_current_theme(self) -> str:
+        return self.current
+
+    def apply_theme(self, _widget, theme_name: str) -> None:
+        self.current = theme_name
+        self.applied.append(theme_name)
+
+
+@pytest.fixture
+def wm(qapp):
+    return WindowManager(_Themes())
+
+
+@pytest.fixture
+def owner(qapp, wm):
+    """A top-level window the manager treats as the one in front."""
+    win = QWidget()
+    win.show()
+    wm._active_window = win
+    yield win
+    if not sip.isdeleted(win):
+        win.deleteLater()
+        _flush_deletes()
+
+
+def _flush_deletes() -> None:
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+# ---------------------------------------------------------------------------
+# Permission dialog
+# ---------------------------------------------------------------------------
+
+
+def test_permission_dialog_is_reused_and_reset(wm, owner):
+    first = wm._permission_dialog("alice", {"view": True, "mouse": True})
+    assert first.get_granted_permissions() == {
+        "view": True,
+        "mouse": True,
+        "keyboard": False,
+    }
+
+    second = wm._permission_dialog("bob", {"keyboard": True})
+
+    assert second is first
+    assert "bob" in second.windowTitle()
+    assert "bob" in second.info_label.text()
+    assert second.get_granted_permissions() == {
+        "view": False,
+        "mouse": False,
+        "keyboard": True,
+    }
+
+
+def test_declined_request_gets_a_fresh_deny_all(wm, owner, monkeypatch):
+    monkeypatch.setattr(PermissionDialog, "exec_", lambda self: QDialog.Rejected)
+
+    answer = wm.show_permission_dialog("alice", {"view": True})
+    assert answer == {"view": False, "mouse": False, "keyboard": False}
+
+    answer["view"] = True
+    assert wm.show_permission_dialog("alice", {"view": True})["view"] is False
+    assert window_manager._DENY_ALL["view"] is False
+
+
+def test_accepted_request_emits_the_ticked_permissions(wm, owner, monkeypatch):
+    monkeypatch.setattr(PermissionDialog, "exec_", lambda self: QDialog.Accepted)
+    answers = []
+    wm.permission_dialog_response_ready.connect(answers.append)
+
+    wm.handle_show_permission_dialog_request("alice", {"view": True})
+
+    assert answers == [{"view": True, "mouse": False, "keyboard": False}]
+
+
+# ---------------------------------------------------------------------------
+# Message boxes
+# ---------------------------------------------------------------------------
+
+
+def test_non_blocking_message_returns_with_box_shown(wm, owner, monkeypatch):
+    def no_nested_loop(self):
+        raise AssertionError("non-blocking message ran exec_()")
+
+    monkeypatch.setattr(QMessageBox, "exec_", no_nested_loop)
+
+    wm.show_message("Peer disconnected", title="Info")
+
+    (box,) = wm._open_messages
+    assert box.isVisible()
+    assert box.parent() is owner
+    assert box.text() == "Peer disconnected"
+
+
+def test_closed_message_box_is_forgotten(wm, owner):
+    wm.show_message("one")
+    wm.show_message("two")
+    assert len(wm._open_messages) == 2
+
+    for box in list(wm._open_messages):
+        box.close()
+    _flush_deletes()
+
+    assert wm._open_messages == set()
+
+
+def test_blocking_messages_share_one_box(wm, owner, monkeypatch):
+    shown = []
+    monkeypatch.setattr(
+        QMessageBox, "exec_", lambda self: shown.append((self, self.text())) or 0
+    )
+
+    wm.show_message("first", blocking=True)
+    wm.show_message("second", title="Login Error", blocking=True)
+
+    (box, _), (again, text) = shown
+    assert again is box is wm._msg_box
+    assert text == "second"
+    assert box.windowTitle() == "Login Error"
+    assert wm._open_messages == set()
+
+
+def test_blocking_message_raised_inside_another_gets_its_own_box(
+    wm, owner, monkeypatch
+):
+    shown = []
+
+    def fake_exec(self):
+        shown.append(self)
+        if len(shown) == 1:
+            self.show()  # as if still waiting for a click
+            wm.show_message("nested", blocking=True)
+            self.hide()
+        return 0
+
+    monkeypatch.setattr(QMessageBox, "exec_", fake_exec)
+
+    wm.show_message("outer", blocking=True)
+
+    outer, nested = shown
+    assert nested is not outer
+    assert outer.text() == "outer"
+    assert nested.text() == "nested"
+
+
+# ---------------------------------------------------------------------------
+# Window teardown
+# ---------------------------------------------------------------------------
+
+
+def test_closing_a_window_closes_its_message_boxes(wm, owner, qapp):
+    other = QWidget()
+    wm.show_message("owned")
+    wm._active_window = other
+    wm.show_message("elsewhere")
+
+    wm._close_dialogs_of(owner)
+    _flush_deletes()
+
+    (left,) = wm._open_messages
+    assert left.text() == "elsewhere"
+    other.deleteLater()
+    _flush_deletes()
+
+
+def test_shared_dialogs_outlive_the_window(wm, owner, monkeypatch):
+    monkeypatch.setattr(QMessageBox, "exec_", lambda self: 0)
+    monkeypatch.setattr(PermissionDialog, "exec_", lambda self: QDialog.Rejected)
+    wm.show_message("blocking", blocking=True)
+    wm.show_permission_dialog("alice", {"view": True})
+    box, dialog = wm._msg_box, wm._perm_dialog
+    assert box.parent() is owner and dialog.parent() is owner
+
+    wm._close_dialogs_of(owner)
+    owner.deleteLater()
+    _flush_deletes()
+
+    assert not sip.isdeleted(box) and box.parent() is None
+    assert not sip.isdeleted(dialog) and dialog.parent() is None
+    wm._active_window = None
+    assert wm._permission_dialog("bob", {}) is dialog
+
+
+def test_visible_dialogs_are_dismissed_on_teardown(wm, owner):
+    box = wm._blocking_message_box(owner)
+    box.show()
+    dialog = wm._permission_dialog("alice", {"view": True})
+    dialog.show()
+    results = []
+    dialog.finished.connect(results.append)
+
+    wm._close_dialogs_of(owner)
+
+    assert not box.isVisible()
+    assert not dialog.isVisible()
+    assert results == [QDialog.Rejected]
+
+
+# ---------------------------------------------------------------------------
+# Theme switching and window creation
+# ---------------------------------------------------------------------------
+
+
+_LIGHT_ICON = ui_login._THEME_ICONS["light"][0]
+
+
+@pytest.fixture
+def windows(wm, monkeypatch, tmp_path):
+    """Login window on screen, registration window built but hidden."""
+    monkeypatch.chdir(tmp_path)  # keep the login window off credentials.json
+    monkeypatch.setattr(LoginWindow, "_cred_cache", None)
+    monkeypatch.setattr(LoginWindow, "_cred_cache_bytes", None)
+    wm.show_login_window()
+    wm._ensure_register_window()
+    yield wm.login_window, wm.register_window
+    for win in (wm.login_window, wm.register_window):
+        win.close()
+        win.deleteLater()
+    _flush_deletes()
+
+
+def test_windows_are_built_on_first_show(wm, monkeypatch, tmp_path):
+    assert wm.login_window is None and wm.register_window is None
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(LoginWindow, "_cred_cache", None)
+    monkeypatch.setattr(LoginWindow, "_cred_cache_bytes", None)
+
+    wm.show_login_window()
+    login = wm.login_window
+    assert wm.register_window is None
+
+    login.register_signal.emit()  # "Sign up" builds the registration window
+    register = wm.register_window
+    assert register is not None and register.isVisible()
+    assert not login.isVisible()
+
+    register.back_to_login_signal.emit()
+    assert wm.login_window is login and login.isVisible()
+    for win in (login, register):
+        win.close()
+        win.deleteLater()
+    _flush_deletes()
+
+
+def test_toggle_theme_repaints_visible_windows_again(wm, windows):
+    login, register = windows
+
+    wm.toggle_theme()
+
+    assert wm.theme_manager.applied[-1] == "light"
+    assert login.updatesEnabled()
+    assert register.updatesEnabled()
+
+
+def test_toggle_theme_refreshes_icons_on_visible_windows_only(wm, windows):
+    login, register = windows
+    register_icon = register.theme_btn.text()
+
+    wm.toggle_theme()
+
+    assert login.theme_btn.text() == _LIGHT_ICON
+    assert register.theme_btn.text() == register_icon
+
+    wm.show_registration_window()  # brought up to date when shown
+    assert register.theme_btn.text() == _LIGHT_ICON
+
+
+class _Counter(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    @pyqtSlot()
+    def hit(self) -> None:
+        self.calls += 1
+
+
+def test_repeat_wiring_connects_once(wm):
+    counter = _Counter()
+
+    for _ in range(3):
+        window_manager._connect_once(wm.logout_requested, counter.hit)
+    wm.logout_requested.emit()
+
+    assert counter.calls == 1
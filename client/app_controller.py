@@ -1,6 +1,5 @@
 # Path: client/app_controller.py
 
-import datetime
 import logging
 import socket
 from typing import Optional
@@ -13,6 +12,7 @@ from PyQt5.QtCore import (
     QObject,
     Qt,
     QThread,
+    QTimer,
     pyqtSignal,
 )
 
@@ -21,6 +21,8 @@ from client.target_client import TargetClient
 from relay_server.database import (
     Database,
 )
+from shared.protocol import MOD_ALT, MOD_CTRL, MOD_META, MOD_SHIFT, wheel_steps
+from shared.utils import clock_hms
 
 try:
     from PIL import ImageGrab
@@ -36,6 +38,11 @@ except ImportError:
 
 logger = logging.getLogger("AppController")
 
+# How often the controller probes the relay round-trip time, and the ceiling
+# used when probes go unanswered.
+RTT_PROBE_INTERVAL_MS = 2000
+RTT_MAX_MS = 1000
+
 
 class AppSignals(QObject):
     message_received = pyqtSignal(str, str, str)
@@ -48,6 +55,7 @@ class AppSignals(QObject):
     permissions_updated = pyqtSignal(dict)
 
     frame_received = pyqtSignal(bytes)
+    rtt_updated = pyqtSignal(int)
 
     client_error = pyqtSignal(int, str)
 
@@ -82,6 +90,12 @@ class AppController:
         self.peer_username: str | None = None
         self.granted_permissions: dict = {}
         self.target_screen_dimensions: tuple[int, int] | None = None
+        # Sub-notch wheel deltas carried over to the next wheel event
+        self._wheel_residual_x = 0
+        self._wheel_residual_y = 0
+
+        self.current_rtt_ms = 0
+        self._rtt_probe_pending = False
 
         self._permission_dialog_result: dict = {}
         self._permission_dialog_event_loop: QEventLoop | None = None
@@ -102,6 +116,10 @@ class AppController:
         self.signals.session_ended.connect(self.wm.update_session_ended_status)
         self.signals.permissions_updated.connect(self.wm.update_controller_permissions)
         self.signals.frame_received.connect(self.wm.display_remote_frame)
+        self.signals.rtt_updated.connect(self.wm.update_network_rtt)
+
+        self._rtt_timer = QTimer(self.signals)
+        self._rtt_timer.timeout.connect(self._probe_rtt)
 
         self.signals.admin_users_fetched.connect(self.wm.update_admin_user_list)
         self.signals.admin_logs_fetched.connect(self.wm.update_admin_log_list)
@@ -221,6 +239,8 @@ class AppController:
                 self.client.on_permission_update(self._handle_permission_update)
                 self.client.on_error(self._handle_client_error)
                 self.client.on_frame_data(self._handle_frame_data)
+                self.client.on_rtt(self._handle_rtt)
+                self._rtt_timer.start(RTT_PROBE_INTERVAL_MS)
             elif role == "target":
                 self.client = TargetClient(host, port, username, password)
                 self.client.on_chat(self._handle_incoming_chat)
@@ -309,7 +329,9 @@ class AppController:
         logger.info(f"Logout requested for user {self.current_username}")
         # Cleanup input controllers before disconnecting
         self._cleanup_input_controllers()
-        
+        self._rtt_timer.stop()
+        self._rtt_probe_pending = False
+
         if self.client:
             try:
                 self.client.disconnect()
@@ -359,7 +381,7 @@ class AppController:
             if not text:
                 return
             if not timestamp:
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+                timestamp = clock_hms()
             _sender = sender or self.client.username
             if isinstance(self.client, (ControllerClient, TargetClient)):
                 self.client.send_chat(text, sender=_sender, timestamp=timestamp)
@@ -447,6 +469,28 @@ class AppController:
         else:
             pass
 
+    def _probe_rtt(self):
+        if not (
+            self.current_role == "controller"
+            and isinstance(self.client, ControllerClient)
+            and self.session_id
+        ):
+            return
+        if self._rtt_probe_pending:
+            # Previous probe still unanswered: treat the link as congested.
+            self.current_rtt_ms = min(max(self.current_rtt_ms, 1) * 2, RTT_MAX_MS)
+            self.signals.rtt_updated.emit(self.current_rtt_ms)
+        try:
+            self.client.send_heartbeat()
+            self._rtt_probe_pending = True
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"RTT probe not sent: {e}")
+
+    def _handle_rtt(self, rtt_ms: int):
+        self._rtt_probe_pending = False
+        self.current_rtt_ms = rtt_ms
+        self.signals.rtt_updated.emit(rtt_ms)
+
     def _handle_incoming_chat(self, sender: str, text: str, timestamp: str):
         logger.debug(f"Incoming chat from {sender}: {text} at {timestamp}")
         if sender != self.current_username:
@@ -583,6 +627,8 @@ class AppController:
                 delattr(self, '_keyboard_controller')
             if hasattr(self, '_mouse_controller'):
                 delattr(self, '_mouse_controller')
+            self._wheel_residual_x = 0
+            self._wheel_residual_y = 0
 
             logger.info("Input controllers cleaned up successfully")
         except Exception as e:
@@ -628,17 +674,17 @@ class AppController:
         else:
             pass
 
-    def _get_key_modifiers_for_pynput(self, event_modifiers_list: list[str]) -> tuple:
-        modifiers = set()
-        for mod in event_modifiers_list:
-            if mod == "shift":
-                modifiers.add(keyboard.Key.shift)
-            elif mod == "ctrl":
-                modifiers.add(keyboard.Key.ctrl)
-            elif mod == "alt":
-                modifiers.add(keyboard.Key.alt)
-            elif mod == "meta":
-                modifiers.add(keyboard.Key.cmd)
+    def _get_key_modifiers_for_pynput(self, mods: int) -> tuple:
+        """Convert the MOD_* bit field of an input event to pynput keys"""
+        modifiers = []
+        if mods & MOD_SHIFT:
+            modifiers.append(keyboard.Key.shift)
+        if mods & MOD_CTRL:
+            modifiers.append(keyboard.Key.ctrl)
+        if mods & MOD_ALT:
+            modifiers.append(keyboard.Key.alt)
+        if mods & MOD_META:
+            modifiers.append(keyboard.Key.cmd)
         return tuple(modifiers)
 
     def _handle_input_data(self, input_event_data: dict):
@@ -715,6 +761,15 @@ class AppController:
 
             elif event_type == "mouserelease":
                 button_name = input_event_data.get("button")
+                norm_x = input_event_data.get("norm_x")
+                norm_y = input_event_data.get("norm_y")
+                if norm_x is not None and norm_y is not None:
+                    # Moves are throttled on the controller, so land on the
+                    # release point before letting go of the button.
+                    self._mouse_controller.position = (
+                        int(norm_x * screen_width),
+                        int(norm_y * screen_height),
+                    )
                 if button_name:
                     button = getattr(mouse.Button, button_name, None)
                     if button:
@@ -724,11 +779,19 @@ class AppController:
                         logger.warning(f"Unknown mouse button: {button_name}")
 
             elif event_type == "wheel":
-                delta_x = input_event_data.get("delta_x", 0)
-                delta_y = input_event_data.get("delta_y", 0)
-                logger.debug(f"Mouse wheel: dx={delta_x}, dy={delta_y}")
-                # Handle horizontal and vertical scrolling
-                self._mouse_controller.scroll(delta_x, delta_y)
+                # Controller sends raw angle deltas; high-resolution wheels
+                # and touchpads report fractions of a notch, so keep the
+                # remainder until it adds up to a whole step.
+                steps_x, self._wheel_residual_x = wheel_steps(
+                    self._wheel_residual_x, input_event_data.get("dx", 0)
+                )
+                steps_y, self._wheel_residual_y = wheel_steps(
+                    self._wheel_residual_y, input_event_data.get("dy", 0)
+                )
+                if steps_x or steps_y:
+                    logger.debug(f"Mouse wheel: dx={steps_x}, dy={steps_y}")
+                    # Handle horizontal and vertical scrolling
+                    self._mouse_controller.scroll(steps_x, steps_y)
 
             # Handle keyboard events
             elif event_type in ("keypress", "keyrelease"):
@@ -736,14 +799,14 @@ class AppController:
                 qt_key_code = input_event_data.get("key_code")
                 text = input_event_data.get("text", "")
                 is_auto_repeat = input_event_data.get("is_auto_repeat", False)
-                modifiers = input_event_data.get("modifiers", [])
+                mods = input_event_data.get("mods", 0)
 
                 # Skip auto-repeat to prevent key spam
                 if is_auto_repeat:
                     return
 
                 # Handle modifier keys first
-                mod_keys = self._get_key_modifiers_for_pynput(modifiers)
+                mod_keys = self._get_key_modifiers_for_pynput(mods)
                 for mod_key in mod_keys:
                     try:
                         if is_press:
@@ -835,20 +898,6 @@ class AppController:
         except Exception as e:
             logger.exception(f"Error handling input event: {input_event_data}")
 
-    def _get_key_modifiers_for_pynput(self, event_modifiers_list: list[str]) -> set:
-        """Convert Qt modifier keys to pynput modifier keys"""
-        modifiers = set()
-        for mod in event_modifiers_list:
-            if mod == "shift":
-                modifiers.add(keyboard.Key.shift)
-            elif mod == "ctrl":
-                modifiers.add(keyboard.Key.ctrl)
-            elif mod == "alt":
-                modifiers.add(keyboard.Key.alt)
-            elif mod == "meta":
-                modifiers.add(keyboard.Key.cmd)
-        return modifiers
-
     def _map_qt_key_to_pynput(self, qt_key_code: int, text: str):
         if (
             text
@@ -907,7 +956,6 @@ class AppController:
         try:
             qt_key_code = event_data.get("key_code")
             text = event_data.get("text", "")
-            modifiers = event_data.get("modifiers", [])
             is_auto_repeat = event_data.get("is_auto_repeat", False)
             
             # Skip auto-repeat events to prevent duplicate key presses
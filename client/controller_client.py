@@ -1,8 +1,8 @@
 # remote_desktop_final/client/controller_client.py
-import datetime  # Changed
 import logging
 import socket
 import threading
+import time
 from typing import (  # Added Dict, Optional, Any, Union
     Any,
     Callable,
@@ -12,6 +12,7 @@ from typing import (  # Added Dict, Optional, Any, Union
 )
 
 from shared.protocol import PacketType, recv, send_json
+from shared.utils import clock_hms
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class ControllerClient:
         )
         self._data_sent_callback: Optional[Callable[[int], None]] = None  # New: Track bytes sent
         self._data_received_callback: Optional[Callable[[int], None]] = None  # New: Track bytes received
+        self._rtt_callback: Optional[Callable[[int], None]] = None
 
         self.session_id: Optional[int] = None
         self.peer_username: Optional[str] = None
@@ -149,12 +151,22 @@ class ControllerClient:
         self._data_sent_callback = sent_callback
         self._data_received_callback = received_callback
 
+    def on_rtt(self, callback: Callable[[int], None]):
+        """Register callback for round-trip measurements: callback(rtt_ms)"""
+        self._rtt_callback = callback
+
+    def send_heartbeat(self) -> None:
+        """Send a HEARTBEAT probe; the relay echoes it back to measure RTT."""
+        if not self.sock:
+            raise ConnectionError("Not connected")
+        send_json(self.sock, PacketType.HEARTBEAT, {"sent_at": time.monotonic()})
+
     def send_chat(self, text: str, sender: str = None, timestamp: str = None) -> None:
         """Send a chat message to the server."""
         if not self.sock:
             raise ConnectionError("Not connected")
         if not timestamp:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            timestamp = clock_hms()
         if not sender:
             sender = self.username
 
@@ -273,7 +285,12 @@ class ControllerClient:
         if self._data_received_callback:
             self._data_received_callback(data_size)
 
-        if ptype is PacketType.CHAT:
+        if ptype is PacketType.HEARTBEAT:
+            if isinstance(data, dict) and self._rtt_callback:
+                sent_at = data.get("sent_at")
+                if isinstance(sent_at, (int, float)):
+                    self._rtt_callback(int((time.monotonic() - sent_at) * 1000))
+        elif ptype is PacketType.CHAT:
             if isinstance(data, dict) and self._chat_callback:
                 sender = data.get("sender", "Unknown")
                 text = data.get("text", "")
@@ -22,6 +22,9 @@ class ThemeManager(QObject):
         super().__init__()
         self._logger = logging.getLogger(__name__)
 
+        # QSS text per theme name, read from disk once per session
+        self._stylesheet_cache: dict[str, str] = {}
+
         # Try to load saved theme, default to dark if none found
         self._current_theme = self._load_saved_theme() or "dark"
         self._logger.info(f"ThemeManager initialized with theme: {self._current_theme}")
@@ -64,6 +67,9 @@ class ThemeManager(QObject):
             self._logger.warning(f"Failed to save theme: {e}")
 
     def _load_stylesheet_content(self, theme_name):
+        cached = self._stylesheet_cache.get(theme_name)
+        if cached is not None:
+            return cached
         # Map theme names to actual file paths
         if theme_name == "dark":
             filename = os.path.join(STYLES_DIR, "default.qss")
@@ -78,10 +84,12 @@ class ThemeManager(QObject):
 
         try:
             with open(filename, "r", encoding="utf-8") as f:
-                return f.read()
+                content = f.read()
         except FileNotFoundError:
             self._logger.warning(f"Stylesheet not found for theme: {theme_name}")
             return ""
+        self._stylesheet_cache[theme_name] = content
+        return content
 
     def apply_theme(self, widget, theme_name):
         # Ensure only valid themes are applied
@@ -92,7 +100,10 @@ class ThemeManager(QObject):
             theme_name = "dark"
 
         content = self._load_stylesheet_content(theme_name)
-        widget.setStyleSheet(content)
+        # Setting a sheet re-parses it and re-polishes every widget, so skip
+        # it when this exact sheet is already in place.
+        if widget.styleSheet() != content:
+            widget.setStyleSheet(content)
         self._current_theme = theme_name
         self._save_theme(theme_name)  # Save the theme for next session
         self.theme_changed.emit(theme_name)
@@ -1,7 +1,7 @@
 # Path: client/ui_admin.py
 import logging
 
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -26,6 +26,12 @@ from PyQt5.QtWidgets import (
 
 log = logging.getLogger(__name__)
 
+# Button text and tooltip per active theme; the icon names the theme it leads to
+_THEME_ICONS = {
+    "light": ("🌙", "Switch to Dark Mode"),
+    "dark": ("☀️", "Switch to Light Mode"),
+}
+
 
 class UserEditDialog(QDialog):
     """Dialog for adding or editing a user."""
@@ -108,6 +114,8 @@ class UserEditDialog(QDialog):
 
 class AdminWindow(QMainWindow):
     logout_signal = pyqtSignal()
+    # Re-emitted as logout_signal on the next event-loop pass (see closeEvent)
+    _close_logout_signal = pyqtSignal()
     toggle_theme_signal = pyqtSignal()
 
     # User management signals
@@ -128,6 +136,7 @@ class AdminWindow(QMainWindow):
     def __init__(self, username: str):
         super().__init__()
         self.username = username
+        self._close_logout_signal.connect(self.logout_signal, Qt.QueuedConnection)
         self._build_ui()
         log.info(f"AdminWindow loaded for {username}")
         self._update_theme_icon(
@@ -336,12 +345,9 @@ class AdminWindow(QMainWindow):
 
     def _update_theme_icon(self, theme_name: str):
         if hasattr(self, "theme_btn"):
-            if theme_name == "light":
-                self.theme_btn.setText("🌙")
-                self.theme_btn.setToolTip("Switch to Dark Mode")
-            else:
-                self.theme_btn.setText("☀️")
-                self.theme_btn.setToolTip("Switch to Light Mode")
+            emoji, tip = _THEME_ICONS.get(theme_name, _THEME_ICONS["dark"])
+            self.theme_btn.setText(emoji)
+            self.theme_btn.setToolTip(tip)
 
     # Slots for AppController signals
     def update_user_list(self, users: list):
@@ -410,5 +416,5 @@ class AdminWindow(QMainWindow):
 
     def closeEvent(self, event):
         log.info(f"AdminWindow for {self.username} is closing. Emitting logout_signal.")
-        self.logout_signal.emit()
+        self._close_logout_signal.emit()
         super().closeEvent(event)
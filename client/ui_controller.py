@@ -11,7 +11,7 @@ import logging
 import time
 
 from PIL import ImageGrab
-from PyQt5.QtCore import QSize, Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import QElapsedTimer, QSize, Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtGui import (
     QImage,
@@ -45,11 +45,58 @@ from shared.protocol import (
     decode_image,
     encode_image,
 )
+from shared.utils import clock_hms
 
 log = logging.getLogger(__name__)
 
-
-# Custom QLabel for capturing input events
+# Payload templates for input events forwarded to the target. Handlers copy
+# the matching template and fill in the per-event fields instead of building
+# a fresh dict (and re-hashing every key) for each event.
+_KEY_EVENT_TMPL = {
+    "type": "keypress",
+    "key_code": 0,
+    "text": "",
+    "is_auto_repeat": False,
+    "mods": 0,
+}
+_MOUSEMOVE_TMPL = {
+    "type": "mousemove",
+    "x": 0,
+    "y": 0,
+    "norm_x": 0.0,
+    "norm_y": 0.0,
+    "buttons": (),
+    "mods": 0,
+}
+_MOUSE_BUTTON_TMPL = {
+    "type": "mousepress",
+    "button": "",
+    "x": 0,
+    "y": 0,
+    "norm_x": 0.0,
+    "norm_y": 0.0,
+    "mods": 0,
+}
+_WHEEL_TMPL = {
+    "type": "wheel",
+    "dx": 0,
+    "dy": 0,
+    "mods": 0,
+}
+
+# Button name tuples are immutable, so one tuple per distinct flag
+# combination is shared by every event carrying that combination.
+_BUTTON_NAMES_CACHE: dict[int, tuple[str, ...]] = {}
+
+# Theme button text per active theme; the icon names the theme it leads to
+_THEME_ICONS = {"light": "🌙", "dark": "☀️"}
+
+# Bounds (ms) for the mouse-move send interval, which follows the network RTT.
+_MOVE_INTERVAL_MIN_MS = 8
+_MOVE_INTERVAL_MAX_MS = 200
+
+# Custom QLabel for capturing input events. Input is captured on the screen
+# view only; the main window never sees these events in Python.
 class InputForwardingLabel(QLabel):
     key_pressed_signal = pyqtSignal(QKeyEvent)
     key_released_signal = pyqtSignal(QKeyEvent)
@@ -61,16 +108,71 @@ class InputForwardingLabel(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFocusPolicy(Qt.StrongFocus)
-        self.setMouseTracking(True)
+        # Hover tracking is switched on by ControllerWindow only while mouse
+        # input is being forwarded, so idle moves never reach Python.
+        self.setMouseTracking(False)
         self.setAlignment(Qt.AlignCenter)
         self.setObjectName("ScreenDisplayWidget")
+        # Let Qt merge bursts of typed characters into one key event.
+        self.setAttribute(Qt.WA_KeyCompression, True)
         self._is_dragging = False
         self._last_click_pos = None
+        self._shown_text: str | None = None
+        self._image_rect: tuple | None = None
+
+    def show_text(self, text: str) -> None:
+        """Show a status message, skipping the relayout if it is already shown."""
+        if text != self._shown_text:
+            self._shown_text = text
+            self.setText(text)
+
+    def setPixmap(self, pixmap: QPixmap) -> None:
+        self._shown_text = None
+        super().setPixmap(pixmap)
+        self._update_image_rect()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_image_rect()
+
+    def _update_image_rect(self) -> None:
+        # Offset and inverse size of the centred pixmap, so mapping a mouse
+        # position is a few multiplications per event.
+        pixmap = self.pixmap()
+        if pixmap is None or pixmap.isNull() or pixmap.width() <= 0:
+            self._image_rect = None
+            return
+        width, height = pixmap.width(), pixmap.height()
+        self._image_rect = (
+            (self.width() - width) / 2,
+            (self.height() - height) / 2,
+            width,
+            height,
+            1.0 / width,
+            1.0 / height,
+        )
+
+    def map_to_image(self, event: QMouseEvent) -> tuple | None:
+        """Return (x, y, norm_x, norm_y) of the event on the shown image."""
+        rect = self._image_rect
+        if rect is None:
+            return None
+        x_offset, y_offset, width, height, inv_width, inv_height = rect
+        x = event.x() - x_offset
+        y = event.y() - y_offset
+        if 0 <= x <= width and 0 <= y <= height:
+            return int(x), int(y), x * inv_width, y * inv_height
+        return None
 
     def keyPressEvent(self, event: QKeyEvent):
+        # The target ignores auto-repeat, so held keys stop here.
+        if event.isAutoRepeat():
+            return
         self.key_pressed_signal.emit(event)
 
     def keyReleaseEvent(self, event: QKeyEvent):
+        if event.isAutoRepeat():
+            return
         self.key_released_signal.emit(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
@@ -96,6 +198,8 @@ class InputForwardingLabel(QLabel):
 
 class ControllerWindow(QMainWindow):
     logout_signal = pyqtSignal()
+    # Re-emitted as logout_signal on the next event-loop pass (see closeEvent)
+    _close_logout_signal = pyqtSignal()
     toggle_theme_signal = pyqtSignal()
     switch_role_signal = pyqtSignal(str)
 
@@ -128,10 +232,27 @@ class ControllerWindow(QMainWindow):
         self._last_bandwidth_update = time.time()
         self._upload_speed = 0
         self._download_speed = 0
+        self._last_bandwidth_text = ""
         
-        self._session_start_time = time.time()
+        # Monotonic session clock; started when a session begins.
+        self._session_elapsed = QElapsedTimer()
+        self._session_last_secs: int | None = -1
         self._frame_timer = QTimer(self)
         self._bandwidth_timer = QTimer(self)
+
+        # Mouse moves are coalesced to at most one per interval; the
+        # interval tracks the RTT reported through set_network_rtt().
+        self._move_interval_ms = _MOVE_INTERVAL_MIN_MS
+        self._move_clock = QElapsedTimer()
+        self._pending_move: dict | None = None
+        self._move_flush_timer = QTimer(self)
+        self._move_flush_timer.setSingleShot(True)
+        self._move_flush_timer.timeout.connect(self._flush_pending_move)
+
+        # Which input handlers are currently connected to the screen view
+        self._forwarding_keyboard = False
+        self._forwarding_mouse = False
+
         self._build_ui()
         self._connect_signals()
         log.info(f"MainWindow loaded for {username} (UID: {user_id}, Role: {role})")
@@ -140,26 +261,12 @@ class ControllerWindow(QMainWindow):
         )
 
     def _connect_signals(self):
+        self._close_logout_signal.connect(self.logout_signal, Qt.QueuedConnection)
         self.screen_record_btn.clicked.connect(self._toggle_screen_recording)
         self.screenshot_btn.clicked.connect(self._take_screenshot)
         self.log_btn.clicked.connect(self._show_logs)
         self.menu_btn.clicked.connect(self._show_menu)
 
-        self.screen_label.key_pressed_signal.connect(self._handle_controller_key_press)
-        self.screen_label.key_released_signal.connect(
-            self._handle_controller_key_release
-        )
-        self.screen_label.mouse_moved_signal.connect(self._handle_controller_mouse_move)
-        self.screen_label.mouse_pressed_signal.connect(
-            self._handle_controller_mouse_press
-        )
-        self.screen_label.mouse_released_signal.connect(
-            self._handle_controller_mouse_release
-        )
-        self.screen_label.wheel_event_signal.connect(
-            self._handle_controller_wheel_event
-        )
-
     def _toggle_screen_recording(self):
         self.is_recording = not self.is_recording
         if self.is_recording:
@@ -356,14 +463,14 @@ class ControllerWindow(QMainWindow):
         self.status_bar.addPermanentWidget(self.fps_label)
         self.status_bar.addPermanentWidget(self.session_timer_label)
 
-        # Set up timers
+        # Set up timers; started from showEvent
         self._timer = QTimer(self)
+        self._timer.setInterval(1000)
         self._timer.timeout.connect(self._update_session_timer)
-        self._timer.start(1000)
 
         self._bandwidth_timer = QTimer(self)
+        self._bandwidth_timer.setInterval(1000)  # Update bandwidth every second
         self._bandwidth_timer.timeout.connect(self._update_bandwidth)
-        self._bandwidth_timer.start(1000)  # Update bandwidth every second
 
         self._frame_timer.timeout.connect(self._send_placeholder_frame)
         self._update_role_ui()
@@ -453,7 +560,7 @@ class ControllerWindow(QMainWindow):
         self.permissions_groupbox.setVisible(is_controller)
         self.target_info_label.setVisible(not is_controller)
         self.role_label.setText(f"Role: {self.role.title()}")
-        self.screen_label.setText(
+        self.screen_label.show_text(
             "Remote screen will appear here"
             if is_controller
             else "Your screen is shared / Waiting for connection"
@@ -482,12 +589,58 @@ class ControllerWindow(QMainWindow):
                 self._frame_timer.stop()
         self.chat_input_lineedit.setEnabled(connected)
         self.chat_send_button.setEnabled(connected)
+        self._rebuild_input_handlers()
+
+    def _rebuild_input_handlers(self):
+        """Connect the screen view's input signals while forwarding is allowed.
+
+        Role, session and permissions change rarely, so they are checked
+        here rather than in the handlers on every event.
+        """
+        in_session = (
+            self.role == "controller"
+            and self.session_id is not None
+            and self.peer_username is not None
+        )
+        keyboard = in_session and self.active_permissions.get("keyboard", False)
+        mouse = in_session and self.active_permissions.get("mouse", False)
+        label = self.screen_label
+
+        if keyboard != self._forwarding_keyboard:
+            self._forwarding_keyboard = keyboard
+            for signal, slot in (
+                (label.key_pressed_signal, self._handle_controller_key_press),
+                (label.key_released_signal, self._handle_controller_key_release),
+            ):
+                if keyboard:
+                    signal.connect(slot)
+                else:
+                    signal.disconnect(slot)
+
+        if mouse != self._forwarding_mouse:
+            self._forwarding_mouse = mouse
+            for signal, slot in (
+                (label.mouse_moved_signal, self._handle_controller_mouse_move),
+                (label.mouse_pressed_signal, self._handle_controller_mouse_press),
+                (label.mouse_released_signal, self._handle_controller_mouse_release),
+                (label.wheel_event_signal, self._handle_controller_wheel_event),
+            ):
+                if mouse:
+                    signal.connect(slot)
+                else:
+                    signal.disconnect(slot)
+            # Hover moves only need to reach Python while they are forwarded.
+            label.setMouseTracking(mouse)
+            if not mouse:
+                self._pending_move = None
+                self._move_flush_timer.stop()
 
     def _on_connect_request(self):
         if self.peer_username:
             self.connect_button.setEnabled(False)
             self.peer_username = None
             self.session_id = None
+            self._rebuild_input_handlers()
             self.connect_requested.emit("")
             self.connect_button.setText("Connect")
             self.connect_button.setEnabled(True)
@@ -509,7 +662,7 @@ class ControllerWindow(QMainWindow):
             self.append_chat_message(
                 self.username,
                 message_text,
-                datetime.datetime.now().isoformat(),
+                clock_hms(),
                 is_self=True,
             )
             self.chat_input_lineedit.clear()
@@ -537,26 +690,40 @@ class ControllerWindow(QMainWindow):
     def append_chat_message(
         self, sender: str, text: str, timestamp_str: str, is_self: bool = False
     ):
-        try:
-            dt_obj = datetime.datetime.fromisoformat(timestamp_str)
-            display_ts = dt_obj.strftime("%H:%M:%S")
-        except ValueError:
-            display_ts = timestamp_str
         if not is_self and sender == self.username:
             return
+        if len(timestamp_str) == 8 and timestamp_str[2] == ":":
+            # Already "HH:MM:SS", which is what the clients send.
+            display_ts = timestamp_str
+        else:
+            try:
+                dt_obj = datetime.datetime.fromisoformat(timestamp_str)
+                display_ts = dt_obj.strftime("%H:%M:%S")
+            except ValueError:
+                display_ts = timestamp_str
         self.chat_area.append_message(sender, text, display_ts, sender == self.username)
 
     def _update_session_timer(self):
         if self.session_id:
-            elapsed_seconds = int(time.time() - self._session_start_time)
+            if not self._session_elapsed.isValid():
+                self._session_elapsed.start()
+            # Nothing to refresh while the status bar cannot be seen.
+            if not self.isVisible() or self.isMinimized():
+                return
+            elapsed_seconds = self._session_elapsed.elapsed() // 1000
+            if elapsed_seconds == self._session_last_secs:
+                return
+            self._session_last_secs = elapsed_seconds
             hours, remainder = divmod(elapsed_seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
             self.session_timer_label.setText(
                 f"Session: {hours:02d}:{minutes:02d}:{seconds:02d}"
             )
         else:
-            self.session_timer_label.setText("Session: --:--:--")
-            self._session_start_time = time.time()
+            self._session_elapsed.invalidate()
+            if self._session_last_secs is not None:
+                self._session_last_secs = None
+                self.session_timer_label.setText("Session: --:--:--")
 
     def _update_bandwidth(self):
         """Update bandwidth display in status bar"""
@@ -569,7 +736,10 @@ class ControllerWindow(QMainWindow):
             download_speed = (self._bytes_received / 1024) / time_diff
             
             # Update display
-            self.bandwidth_label.setText(f"↑{upload_speed:.1f} KB/s ↓{download_speed:.1f} KB/s")
+            bandwidth_text = f"↑{upload_speed:.1f} KB/s ↓{download_speed:.1f} KB/s"
+            if bandwidth_text != self._last_bandwidth_text:
+                self._last_bandwidth_text = bandwidth_text
+                self.bandwidth_label.setText(bandwidth_text)
             
             # Reset counters
             self._bytes_sent = 0
@@ -586,10 +756,7 @@ class ControllerWindow(QMainWindow):
 
     def _update_theme_icon(self, theme_name: str):
         if hasattr(self, "theme_btn"):
-            if theme_name == "light":
-                self.theme_btn.setText("🌙")
-            else:
-                self.theme_btn.setText("☀️")
+            self.theme_btn.setText(_THEME_ICONS.get(theme_name, "☀️"))
 
     def show_error(self, message: str, title: str = "Error"):
         QMessageBox.critical(self, title, message)
@@ -639,6 +806,7 @@ class ControllerWindow(QMainWindow):
             self.perm_view_checkbox.setChecked(permissions.get("view", False))
             self.perm_mouse_checkbox.setChecked(permissions.get("mouse", False))
             self.perm_keyboard_checkbox.setChecked(permissions.get("keyboard", False))
+            self._rebuild_input_handlers()
             log.info(f"Controller UI updated with permissions: {permissions}")
 
     def display_frame(self, frame_bytes: bytes):
@@ -648,17 +816,19 @@ class ControllerWindow(QMainWindow):
             current_time = time.time()
             time_diff = current_time - self._last_fps_update
             if time_diff >= 1.0:  # Update FPS every second
-                self._current_fps = int(self._frame_count / time_diff)
-                self.fps_label.setText(f"FPS: {self._current_fps}")
+                current_fps = int(self._frame_count / time_diff)
+                if current_fps != self._current_fps:
+                    self._current_fps = current_fps
+                    self.fps_label.setText(f"FPS: {current_fps}")
                 self._frame_count = 0
                 self._last_fps_update = current_time
 
             if not self.active_permissions.get("view", False):
-                self.screen_label.setText("View permission not granted by target.")
+                self.screen_label.show_text("View permission not granted by target.")
                 return
             if not frame_bytes:
                 log.warning("Received empty frame_bytes in display_frame.")
-                self.screen_label.setText("Received empty frame.")
+                self.screen_label.show_text("Received empty frame.")
                 return
             try:
                 pil_image = decode_image(frame_bytes)
@@ -679,14 +849,14 @@ class ControllerWindow(QMainWindow):
                 )
                 if qimage.isNull():
                     log.error("Failed to convert PIL image to QImage (isNull).")
-                    self.screen_label.setText(
+                    self.screen_label.show_text(
                         "Error displaying frame (conversion failed)."
                     )
                     return
                 pixmap = QPixmap.fromImage(qimage)
                 if pixmap.isNull():
                     log.error("Failed to create QPixmap from QImage (isNull).")
-                    self.screen_label.setText(
+                    self.screen_label.show_text(
                         "Error displaying frame (pixmap creation failed)."
                     )
                     return
@@ -698,34 +868,33 @@ class ControllerWindow(QMainWindow):
                 self.screen_label.setPixmap(scaled_pixmap)
             except Exception as e:
                 log.exception("Error processing/displaying frame data.")
-                self.screen_label.setText(f"Error displaying frame: {e}")
+                self.screen_label.show_text(f"Error displaying frame: {e}")
         else:
             log.warning("display_frame called on non-controller instance.")
 
-    def _get_qt_modifiers(self, event_modifiers: Qt.KeyboardModifiers) -> list[str]:
-        modifiers = []
-        if event_modifiers & Qt.ShiftModifier:
-            modifiers.append("shift")
-        if event_modifiers & Qt.ControlModifier:
-            modifiers.append("ctrl")
-        if event_modifiers & Qt.AltModifier:
-            modifiers.append("alt")
-        if event_modifiers & Qt.MetaModifier:
-            modifiers.append("meta")
-        return modifiers
-
-    def _get_active_mouse_buttons(self, qt_buttons_flags: Qt.MouseButtons) -> list[str]:
-        active_buttons = []
-        if qt_buttons_flags & Qt.LeftButton:
-            active_buttons.append("left")
-        if qt_buttons_flags & Qt.RightButton:
-            active_buttons.append("right")
-        if qt_buttons_flags & Qt.MiddleButton:
-            active_buttons.append("middle")
-        if qt_buttons_flags & Qt.ExtraButton1:
-            active_buttons.append("x1")
-        if qt_buttons_flags & Qt.ExtraButton2:
-            active_buttons.append("x2")
+    def _get_qt_modifiers(self, event_modifiers: Qt.KeyboardModifiers) -> int:
+        # Qt keeps Shift/Control/Alt/Meta in four adjacent bits starting at
+        # bit 25, which line up with the MOD_* flags in shared.protocol.
+        return (int(event_modifiers) >> 25) & 0xF
+
+    def _get_active_mouse_buttons(
+        self, qt_buttons_flags: Qt.MouseButtons
+    ) -> tuple[str, ...]:
+        flags = int(qt_buttons_flags)
+        active_buttons = _BUTTON_NAMES_CACHE.get(flags)
+        if active_buttons is None:
+            names = []
+            if qt_buttons_flags & Qt.LeftButton:
+                names.append("left")
+            if qt_buttons_flags & Qt.RightButton:
+                names.append("right")
+            if qt_buttons_flags & Qt.MiddleButton:
+                names.append("middle")
+            if qt_buttons_flags & Qt.ExtraButton1:
+                names.append("x1")
+            if qt_buttons_flags & Qt.ExtraButton2:
+                names.append("x2")
+            active_buttons = _BUTTON_NAMES_CACHE[flags] = tuple(names)
         return active_buttons
 
     def _map_qt_mouse_button(self, qt_button: Qt.MouseButton) -> str | None:
@@ -741,196 +910,152 @@ class ControllerWindow(QMainWindow):
             return "x2"
         return None
 
+    # Forwarding handlers: connected by _rebuild_input_handlers() only while
+    # the matching permission is held, so they do no state checks.
     def _handle_controller_key_press(self, event: QKeyEvent):
-        if (
-            self.role == "controller"
-            and self.session_id
-            and self.peer_username
-            and self.active_permissions.get("keyboard", False)
-        ):
-            key_data = {
-                "type": "keypress",
-                "key_code": event.key(),
-                "text": event.text(),
-                "is_auto_repeat": event.isAutoRepeat(),
-                "modifiers": self._get_qt_modifiers(event.modifiers()),
-            }
-            self.input_event_generated.emit(key_data)
-            log.debug(f"Controller key press: {key_data}")
+        text = event.text()
+        mods = self._get_qt_modifiers(event.modifiers())
+        if event.count() > 1 and len(text) > 1:
+            # Compressed event: replay all but the last character as
+            # full keystrokes; the last one gets its own release later.
+            for char in text[:-1]:
+                for event_type in ("keypress", "keyrelease"):
+                    key_data = _KEY_EVENT_TMPL.copy()
+                    key_data["type"] = event_type
+                    key_data["text"] = char
+                    key_data["mods"] = mods
+                    self.input_event_generated.emit(key_data)
+            text = text[-1]
+        key_data = _KEY_EVENT_TMPL.copy()
+        key_data["key_code"] = event.key()
+        key_data["text"] = text
+        key_data["mods"] = mods
+        self.input_event_generated.emit(key_data)
+        log.debug(f"Controller key press: {key_data}")
 
     def _handle_controller_key_release(self, event: QKeyEvent):
-        if (
-            self.role == "controller"
-            and self.session_id
-            and self.peer_username
-            and self.active_permissions.get("keyboard", False)
-        ):
-            key_data = {
-                "type": "keyrelease",
-                "key_code": event.key(),
-                "text": event.text(),
-                "is_auto_repeat": event.isAutoRepeat(),
-                "modifiers": self._get_qt_modifiers(event.modifiers()),
-            }
-            self.input_event_generated.emit(key_data)
-            log.debug(f"Controller key release: {key_data}")
+        key_data = _KEY_EVENT_TMPL.copy()
+        key_data["type"] = "keyrelease"
+        key_data["key_code"] = event.key()
+        key_data["text"] = event.text()
+        key_data["mods"] = self._get_qt_modifiers(event.modifiers())
+        self.input_event_generated.emit(key_data)
+        log.debug(f"Controller key release: {key_data}")
 
     def _handle_controller_mouse_move(self, event: QMouseEvent):
+        mapped = self.screen_label.map_to_image(event)
+        if mapped is None:
+            return
+        mouse_data = _MOUSEMOVE_TMPL.copy()
+        (
+            mouse_data["x"],
+            mouse_data["y"],
+            mouse_data["norm_x"],
+            mouse_data["norm_y"],
+        ) = mapped
+        mouse_data["buttons"] = self._get_active_mouse_buttons(event.buttons())
+        mouse_data["mods"] = self._get_qt_modifiers(event.modifiers())
+        self._queue_mouse_move(mouse_data)
+        log.debug(f"Mouse move data: {mouse_data}")
+
+    def _queue_mouse_move(self, mouse_data: dict):
         if (
-            self.role == "controller"
-            and self.session_id
-            and self.peer_username
-            and self.active_permissions.get("mouse", False)
+            not self._move_clock.isValid()
+            or self._move_clock.elapsed() >= self._move_interval_ms
         ):
-            label_size = self.screen_label.size()
-            if label_size.width() <= 0 or label_size.height() <= 0:
-                log.warning("Screen label has zero dimensions, cannot normalize mouse coordinates.")
-                return
+            self._pending_move = None
+            self._move_flush_timer.stop()
+            self._move_clock.start()
+            self.input_event_generated.emit(mouse_data)
+        else:
+            # Only the latest position matters; it goes out when the
+            # current interval ends.
+            self._pending_move = mouse_data
+            if not self._move_flush_timer.isActive():
+                self._move_flush_timer.start(
+                    self._move_interval_ms - self._move_clock.elapsed()
+                )
 
-            # Get the actual QPixmap size being displayed
-            pixmap = self.screen_label.pixmap()
-            if pixmap:
-                pixmap_rect = self.screen_label.pixmap().rect()
-                scaled_rect = pixmap.scaled(
-                    label_size.width(), 
-                    label_size.height(),
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                ).rect()
-
-                # Calculate the actual display area within the label
-                x_offset = (label_size.width() - scaled_rect.width()) / 2
-                y_offset = (label_size.height() - scaled_rect.height()) / 2
-
-                # Adjust mouse coordinates relative to the actual display area
-                mouse_x = event.x() - x_offset
-                mouse_y = event.y() - y_offset
-
-                # Normalize coordinates only if they're within the display area
-                if (0 <= mouse_x <= scaled_rect.width() and 
-                    0 <= mouse_y <= scaled_rect.height()):
-                    norm_x = mouse_x / scaled_rect.width()
-                    norm_y = mouse_y / scaled_rect.height()
-
-                    mouse_data = {
-                        "type": "mousemove",
-                        "x": int(mouse_x),
-                        "y": int(mouse_y),
-                        "norm_x": norm_x,
-                        "norm_y": norm_y,
-                        "buttons": self._get_active_mouse_buttons(event.buttons()),
-                        "modifiers": self._get_qt_modifiers(event.modifiers()),
-                    }
-                    self.input_event_generated.emit(mouse_data)
-                    log.debug(f"Mouse move data: {mouse_data}")
+    def _flush_pending_move(self):
+        if self._pending_move is not None:
+            mouse_data, self._pending_move = self._pending_move, None
+            self._move_flush_timer.stop()
+            self._move_clock.start()
+            self.input_event_generated.emit(mouse_data)
+
+    def set_network_rtt(self, rtt_ms: int):
+        """Adapt the mouse-move send interval to the measured round trip."""
+        self._move_interval_ms = max(
+            _MOVE_INTERVAL_MIN_MS, min(_MOVE_INTERVAL_MAX_MS, rtt_ms)
+        )
 
     def _handle_controller_mouse_press(self, event: QMouseEvent):
-        if (
-            self.role == "controller"
-            and self.session_id
-            and self.peer_username
-            and self.active_permissions.get("mouse", False)
-        ):
-            button_name = self._map_qt_mouse_button(event.button())
-            if button_name:
-                label_size = self.screen_label.size()
-                pixmap = self.screen_label.pixmap()
-                if pixmap:
-                    pixmap_rect = pixmap.rect()
-                    scaled_rect = pixmap.scaled(
-                        label_size.width(), 
-                        label_size.height(),
-                        Qt.KeepAspectRatio, 
-                        Qt.SmoothTransformation
-                    ).rect()
-
-                    x_offset = (label_size.width() - scaled_rect.width()) / 2
-                    y_offset = (label_size.height() - scaled_rect.height()) / 2
-
-                    mouse_x = event.x() - x_offset
-                    mouse_y = event.y() - y_offset
-
-                    if (0 <= mouse_x <= scaled_rect.width() and 
-                        0 <= mouse_y <= scaled_rect.height()):
-                        norm_x = mouse_x / scaled_rect.width()
-                        norm_y = mouse_y / scaled_rect.height()
-
-                        mouse_data = {
-                            "type": "mousepress",
-                            "button": button_name,
-                            "x": int(mouse_x),
-                            "y": int(mouse_y),
-                            "norm_x": norm_x,
-                            "norm_y": norm_y,
-                            "modifiers": self._get_qt_modifiers(event.modifiers()),
-                        }
-                        self.input_event_generated.emit(mouse_data)
-                        log.debug(f"Mouse press data: {mouse_data}")
+        button_name = self._map_qt_mouse_button(event.button())
+        if not button_name:
+            return
+        mapped = self.screen_label.map_to_image(event)
+        if mapped is None:
+            return
+        mouse_data = _MOUSE_BUTTON_TMPL.copy()
+        mouse_data["button"] = button_name
+        (
+            mouse_data["x"],
+            mouse_data["y"],
+            mouse_data["norm_x"],
+            mouse_data["norm_y"],
+        ) = mapped
+        mouse_data["mods"] = self._get_qt_modifiers(event.modifiers())
+        # Keep ordering: a held-back move goes out first.
+        self._flush_pending_move()
+        self.input_event_generated.emit(mouse_data)
+        log.debug(f"Mouse press data: {mouse_data}")
 
     def _handle_controller_mouse_release(self, event: QMouseEvent):
-        if (
-            self.role == "controller"
-            and self.session_id
-            and self.peer_username
-            and self.active_permissions.get("mouse", False)
-        ):
-            button_name = self._map_qt_mouse_button(event.button())
-            if button_name:
-                label_size = self.screen_label.size()
-                pixmap = self.screen_label.pixmap()
-                if pixmap:
-                    pixmap_rect = pixmap.rect()
-                    scaled_rect = pixmap.scaled(
-                        label_size.width(), 
-                        label_size.height(),
-                        Qt.KeepAspectRatio, 
-                        Qt.SmoothTransformation
-                    ).rect()
-
-                    x_offset = (label_size.width() - scaled_rect.width()) / 2
-                    y_offset = (label_size.height() - scaled_rect.height()) / 2
-
-                    mouse_x = event.x() - x_offset
-                    mouse_y = event.y() - y_offset
-
-                    if (0 <= mouse_x <= scaled_rect.width() and 
-                        0 <= mouse_y <= scaled_rect.height()):
-                        norm_x = mouse_x / scaled_rect.width()
-                        norm_y = mouse_y / scaled_rect.height()
-
-                        mouse_data = {
-                            "type": "mouserelease",
-                            "button": button_name,
-                            "x": int(mouse_x),
-                            "y": int(mouse_y),
-                            "norm_x": norm_x,
-                            "norm_y": norm_y,
-                            "modifiers": self._get_qt_modifiers(event.modifiers()),
-                        }
-                        self.input_event_generated.emit(mouse_data)
-                        log.debug(f"Mouse release data: {mouse_data}")
+        button_name = self._map_qt_mouse_button(event.button())
+        if not button_name:
+            return
+        mapped = self.screen_label.map_to_image(event)
+        if mapped is None:
+            return
+        mouse_data = _MOUSE_BUTTON_TMPL.copy()
+        mouse_data["type"] = "mouserelease"
+        mouse_data["button"] = button_name
+        (
+            mouse_data["x"],
+            mouse_data["y"],
+            mouse_data["norm_x"],
+            mouse_data["norm_y"],
+        ) = mapped
+        mouse_data["mods"] = self._get_qt_modifiers(event.modifiers())
+        self._flush_pending_move()
+        self.input_event_generated.emit(mouse_data)
+        log.debug(f"Mouse release data: {mouse_data}")
 
     def _handle_controller_wheel_event(self, event: QWheelEvent):
-        if (
-            self.role == "controller"
-            and self.session_id
-            and self.peer_username
-            and self.active_permissions.get("mouse", False)
-        ):
-            delta_y = event.angleDelta().y()
-            delta_x = event.angleDelta().x()
-            wheel_data = {
-                "type": "wheel",
-                "delta_x": delta_x / 120 if delta_x != 0 else 0,
-                "delta_y": delta_y / 120 if delta_y != 0 else 0,
-                "modifiers": self._get_qt_modifiers(event.modifiers()),
-            }
-            self.input_event_generated.emit(wheel_data)
-            log.debug(f"Controller wheel event: {wheel_data}")
+        # Raw angle deltas (eighths of a degree); the target converts
+        # them to wheel steps.
+        angle_delta = event.angleDelta()
+        wheel_data = _WHEEL_TMPL.copy()
+        wheel_data["dx"] = angle_delta.x()
+        wheel_data["dy"] = angle_delta.y()
+        wheel_data["mods"] = self._get_qt_modifiers(event.modifiers())
+        self.input_event_generated.emit(wheel_data)
+        log.debug(f"Controller wheel event: {wheel_data}")
+
+    def showEvent(self, event):
+        # Status-bar clocks only need to tick once the window is on screen
+        if not self._timer.isActive():
+            self._timer.start()
+        if not self._bandwidth_timer.isActive():
+            self._bandwidth_timer.start()
+        super().showEvent(event)
 
     def closeEvent(self, event):
         log.info(
             f"ControllerWindow for {self.username} is closing. Emitting logout_signal."
         )
-        self.logout_signal.emit()
+        # Queued so the window closes at once; logout (socket shutdown and the
+        # confirmation prompt) runs on the next event-loop pass. A queued
+        # emission is dropped if the window is deleted first.
+        self._close_logout_signal.emit()
         super().closeEvent(event)
@@ -4,21 +4,21 @@ LoginWindow – Lightweight login form used by WindowManager.
 
 Signals
 -------
-login_attempt_signal(str base_addr, str username, str password, bool remember)
+login_attempt_signal(str base_addr, str username, str password, str role, bool remember)
+                               – role is "" unless built with with_role=True
 register_signal()              – open registration form
 toggle_theme_signal()          – toggle light / dark theme
 """
 
-import json
 import logging
-import os
-import re
+from collections import namedtuple
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon, QIntValidator, QPixmap
 from PyQt5.QtWidgets import QComboBox  # Added QComboBox
 from PyQt5.QtWidgets import (
     QCheckBox,
+    QCompleter,
     QHBoxLayout,
     QLabel,
     QLineEdit,
@@ -31,6 +31,178 @@ from PyQt5.QtWidgets import (
 
 log = logging.getLogger(__name__)
 
+_CREDENTIALS_FILE = "credentials.json"
+
+# Theme name -> (toggle button text, tooltip)
+_THEME_ICONS = {
+    "dark": ("🌙", "Switch to Light Mode"),
+    "light": ("☀️", "Switch to Dark Mode"),
+}
+
+_VALID_ROLES = frozenset({"controller", "target"})
+
+# One read of every form field, taken when the user submits
+_Creds = namedtuple("_Creds", "ip port user pwd role remember")
+_KEYRING_SERVICE = "scu_remote_desktop"
+
+# keyring is optional and slow to import: resolved on first use, False when
+# it is not installed (passwords are then simply not remembered).
+_keyring = None
+
+
+def _get_keyring():
+    global _keyring
+    if _keyring is None:
+        try:
+            import keyring
+
+            _keyring = keyring
+        except ImportError:
+            _keyring = False
+            log.info("keyring not installed; saved logins will not keep passwords.")
+    return _keyring or None
+
+# Widget styles, matched by object name. They are set once on the window
+# so Qt parses a single sheet per LoginWindow instead of one per widget.
+# The themed "Remember me" box is styled by the app-wide theme sheets.
+_THEME_BTN_QSS = """
+QPushButton#theme_btn {
+    font-size: 24px;
+    padding: 5px;
+    border: none;
+    background: transparent;
+}
+QPushButton#theme_btn:hover {
+    background: rgba(0, 0, 0, 0.1);
+    border-radius: 4px;
+}
+"""
+_LOGIN_BTN_QSS = """
+QPushButton#login_btn {
+    background: #2ecc71;
+    color: white;
+    font-weight: bold;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+    font-size: 14px;  /* Larger font */
+}
+QPushButton#login_btn:hover {
+    background: #27ae60;
+}
+QPushButton#login_btn:pressed {
+    background: #219a52;
+}
+"""
+_REG_BTN_QSS = """
+QPushButton#reg_btn {
+    background: #3498db;
+    color: white;
+    font-weight: bold;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+    font-size: 14px;  /* Larger font */
+}
+QPushButton#reg_btn:hover {
+    background: #2980b9;
+}
+QPushButton#reg_btn:pressed {
+    background: #2472a4;
+}
+"""
+# A QPalette colour would be overridden by the app-wide ``QLabel { color }``
+# rule, so the error colour rides along in the window sheet instead.
+_ERR_LBL_QSS = """
+QLabel#err_lbl {
+    color: #e74c3c;
+}
+"""
+_LOGIN_QSS = (
+    _THEME_BTN_QSS + _LOGIN_BTN_QSS + _REG_BTN_QSS + _ERR_LBL_QSS
+)
+
+
+def _is_ipv4(s: str) -> bool:
+    """Dotted-quad IPv4 check as a single-pass state machine over the chars.
+
+    Octets with leading zeros ("010") are rejected: inet_aton and friends
+    read them as octal, so they would not name the address the user typed.
+    """
+    octet_val = octet_digits = dots = 0
+    for c in s:
+        o = ord(c)
+        if 48 <= o <= 57:  # '0'..'9'
+            if octet_digits and not octet_val:  # digit after a leading '0'
+                return False
+            octet_val = octet_val * 10 + (o - 48)
+            octet_digits += 1
+            if octet_digits > 3 or octet_val > 255:
+                return False
+        elif o == 46 and octet_digits and dots < 3:  # '.' closing an octet
+            dots += 1
+            octet_val = octet_digits = 0
+        else:
+            return False
+    return dots == 3 and octet_digits > 0
+
+
+# Loaded on first use; QIcon needs a QApplication to render
+_EYE_ICON: QIcon | None = None
+
+# One parentless validator shared by every port field; it keeps no
+# per-widget state, so there is no need for a fresh QObject per window.
+_PORT_VALIDATOR: QIntValidator | None = None
+
+
+def _normalize_credentials(data) -> dict:
+    """Coerce a decoded credentials file into the column-wise account layout."""
+    if not isinstance(data, dict):
+        data = {}
+    if "users" not in data:
+        # Old single-account layout: {"username", "password", "role", "remember_me"}
+        if data.get("remember_me") and data.get("username"):
+            data = {
+                "users": [data["username"]],
+                "roles": [data.get("role", "controller")],
+                "last_idx": 0,
+            }
+        else:
+            data = {}
+    users = data.get("users")
+    roles = data.get("roles")
+    if not (
+        isinstance(users, list)
+        and isinstance(roles, list)
+        and len(users) == len(roles)
+    ):
+        users, roles = [], []
+    last_idx = data.get("last_idx", -1)
+    return {
+        "users": [str(u) for u in users],
+        "roles": [str(r) for r in roles],
+        "last_idx": last_idx if isinstance(last_idx, int) else -1,
+    }
+
+
+class _PasswordLineEdit(QLineEdit):
+    """Password field with a trailing eye action that toggles visibility."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        global _EYE_ICON
+        if _EYE_ICON is None:
+            _EYE_ICON = QIcon("assets/icons/eye.svg")
+        self.setEchoMode(QLineEdit.Password)
+        self._toggle_act = self.addAction(_EYE_ICON, QLineEdit.TrailingPosition)
+        self._toggle_act.setToolTip("Show password")
+        self._toggle_act.triggered.connect(self._toggle)
+
+    def _toggle(self) -> None:
+        hidden = self.echoMode() == QLineEdit.Password
+        self.setEchoMode(QLineEdit.Normal if hidden else QLineEdit.Password)
+        self._toggle_act.setToolTip("Hide password" if hidden else "Show password")
+
 
 class LoginWindow(QWidget):
     # -------------------------------------------------- signals
@@ -43,9 +215,20 @@ class LoginWindow(QWidget):
     DEFAULT_IP = "127.0.0.1"
     DEFAULT_PORT = "9009"
 
+    # Parsed credentials file and its exact bytes, shared by all instances so
+    # re-opening the window does not hit the disk and unchanged saves are
+    # skipped. _cred_cache is None until the file has been read once.
+    _cred_cache: dict | None = None
+    _cred_cache_bytes: bytes | None = None
+
+    # Decoded + scaled logo pixmaps, keyed by (path, width, height)
+    _LOGO_CACHE: dict[tuple[str, int, int], QPixmap] = {}
+
     # -------------------------------------------------- ctor
-    def __init__(self) -> None:
+    def __init__(self, *, with_role: bool = False) -> None:
         super().__init__()
+        self._with_role = with_role
+        self.role_combo: QComboBox | None = None
         self._build_ui()
 
     # -------------------------------------------------- ui builder
@@ -59,20 +242,7 @@ class LoginWindow(QWidget):
         self.theme_btn = QPushButton("🌙")
         self.theme_btn.setCursor(Qt.PointingHandCursor)
         self.theme_btn.setFlat(True)
-        self.theme_btn.setStyleSheet(
-            """
-            QPushButton { 
-                font-size: 24px; 
-                padding: 5px;
-                border: none;
-                background: transparent;
-            }
-            QPushButton:hover {
-                background: rgba(0, 0, 0, 0.1);
-                border-radius: 4px;
-            }
-        """
-        )
+        self.theme_btn.setObjectName("theme_btn")
         self.theme_btn.clicked.connect(self.toggle_theme_signal.emit)
         top.addWidget(self.theme_btn)
         self._update_theme_icon("dark")  # Set default icon
@@ -84,13 +254,17 @@ class LoginWindow(QWidget):
 
         logo = QLabel()
         logo.setAlignment(Qt.AlignCenter)
-        pm = QPixmap("assets/icons/logo.png")
+        key = ("assets/icons/logo.png", 160, 160)  # Larger logo
+        pm = LoginWindow._LOGO_CACHE.get(key)
+        if pm is None:
+            raw = QPixmap(key[0])
+            if not raw.isNull():
+                raw = raw.scaled(
+                    key[1], key[2], Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
+            pm = LoginWindow._LOGO_CACHE[key] = raw
         if not pm.isNull():
-            logo.setPixmap(
-                pm.scaled(
-                    160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )  # Larger logo
-            )
+            logo.setPixmap(pm)
         body.addWidget(logo)
 
         title = QLabel("SCU Remote Desktop")  # Changed from "Login"
@@ -107,7 +281,10 @@ class LoginWindow(QWidget):
         srv_row = QHBoxLayout()
         self.ip_in = QLineEdit(self.DEFAULT_IP)
         self.port_in = QLineEdit(self.DEFAULT_PORT)
-        self.port_in.setValidator(QIntValidator(1, 65535, self))
+        global _PORT_VALIDATOR
+        if _PORT_VALIDATOR is None:
+            _PORT_VALIDATOR = QIntValidator(1, 65535)
+        self.port_in.setValidator(_PORT_VALIDATOR)
         self.port_in.setFixedWidth(80)
         srv_row.addWidget(self.ip_in, 3)
         srv_row.addWidget(QLabel(":"), 0)
@@ -120,59 +297,26 @@ class LoginWindow(QWidget):
         body.addWidget(self.user_in)
 
         body.addWidget(QLabel("Password:"))
-        self.pass_in = QLineEdit()
-        self.pass_in.setEchoMode(QLineEdit.Password)
+        self.pass_in = _PasswordLineEdit(self)
         body.addWidget(self.pass_in)
 
         # Role selection
-        body.addWidget(QLabel("Login as:"))
-        self.role_combo = QComboBox()
-        self.role_combo.addItems(["Controller", "Target"])
-        body.addWidget(self.role_combo)
+        if self._with_role:
+            body.addWidget(QLabel("Login as:"))
+            self.role_combo = QComboBox()
+            self.role_combo.addItems(["Controller", "Target"])
+            body.addWidget(self.role_combo)
 
         # Remember‑me
         self.remember_chk = QCheckBox("Remember me")
-        self.remember_chk.setStyleSheet(
-            """
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 1px solid #999;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-image: url(assets/icons/checkmark.svg);
-                background-position: center;
-                background-repeat: no-repeat;
-                border: 1px solid #0078d7;
-            }
-        """
-        )
+        self.remember_chk.setObjectName("remember_chk")
         body.addWidget(self.remember_chk)
         body.addSpacing(10)
 
         # Login button
         self.login_btn = QPushButton("Login")
         self.login_btn.setMinimumHeight(40)  # Taller button
-        self.login_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: #2ecc71;
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-size: 14px;  /* Larger font */
-            }
-            QPushButton:hover {
-                background: #27ae60;
-            }
-            QPushButton:pressed {
-                background: #219a52;
-            }
-        """
-        )
+        self.login_btn.setObjectName("login_btn")
         self.login_btn.setDefault(True)
         self.login_btn.clicked.connect(self._on_login)
         body.addWidget(self.login_btn)
@@ -180,32 +324,14 @@ class LoginWindow(QWidget):
         # Register button
         self.reg_btn = QPushButton("Create Account")
         self.reg_btn.setMinimumHeight(40)  # Taller button
-        self.reg_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: #3498db;
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-size: 14px;  /* Larger font */
-            }
-            QPushButton:hover {
-                background: #2980b9;
-            }
-            QPushButton:pressed {
-                background: #2472a4;
-            }
-        """
-        )
+        self.reg_btn.setObjectName("reg_btn")
         self.reg_btn.clicked.connect(self.register_signal.emit)
         body.addWidget(self.reg_btn)
 
         # Error label (hidden by default)
         self.err_lbl = QLabel("")
         self.err_lbl.setAlignment(Qt.AlignCenter)
-        self.err_lbl.setStyleSheet("color:#e74c3c;")
+        self.err_lbl.setObjectName("err_lbl")
         self.err_lbl.hide()
         body.addWidget(self.err_lbl)
 
@@ -214,80 +340,223 @@ class LoginWindow(QWidget):
         root.setContentsMargins(0, 5, 0, 0)
         root.addLayout(top)
         root.addLayout(body)
+        self.setStyleSheet(_LOGIN_QSS)
         self.user_in.setFocus()
 
-        # Load saved credentials if remember me was checked
-        self._load_saved_credentials()
+        # Load saved credentials if remember me was checked. Deferred to the
+        # event loop so the first paint does not wait on the disk read.
+        QTimer.singleShot(0, self._load_saved_credentials)
 
     # -------------------------------------------------- helpers
+    def _snapshot(self) -> _Creds:
+        """Read all form fields once."""
+        if self.role_combo is None:
+            role = ""
+        else:
+            # Get selected role, default to 'controller' if something goes wrong
+            sel = self.role_combo.currentText().lower()
+            role = sel if sel in _VALID_ROLES else "controller"
+        return _Creds(
+            self.ip_in.text().strip(),
+            self.port_in.text(),  # the validator admits digits only
+            self.user_in.text().strip(),
+            self.pass_in.text(),
+            role,
+            self.remember_chk.isChecked(),
+        )
+
     def _on_login(self) -> None:
-        ip, port = self.ip_in.text().strip(), self.port_in.text().strip()
-        user, pwd = self.user_in.text().strip(), self.pass_in.text()
-        # Get selected role, default to 'controller' if something goes wrong
-        selected_role_text = self.role_combo.currentText().lower()
-        role = "controller" if selected_role_text == "controller" else "target"
-        remember = self.remember_chk.isChecked()
-
-        if not self._validate(ip, port, user):
+        c = self._snapshot()
+        if not self._validate(c):
             return
 
         # Save credentials if remember me is checked
-        self._save_credentials()  # This might need to save role too if we want to remember it
+        self._save_credentials(c)
 
-        base_addr = f"{ip}:{port}"
-        log.info("Login attempt @ %s by %s as %s", base_addr, user, role)
+        base_addr = f"{c.ip}:{c.port}"
+        log.info("Login attempt @ %s by %s as %s", base_addr, c.user, c.role)
         self.err_lbl.hide()
-        self.login_attempt_signal.emit(base_addr, user, pwd, role, remember)
+        self.login_attempt_signal.emit(base_addr, c.user, c.pwd, c.role, c.remember)
+
+    @classmethod
+    def _read_credentials(cls) -> dict:
+        """Return the saved accounts, reading the file only once per process.
+
+        The record is kept column-wise: ``users`` and ``roles`` are parallel
+        lists and ``last_idx`` points at the account to pre-fill (-1 for
+        none). Passwords live in the OS keyring, never in the file. Files
+        written in the old single-account layout are converted on read.
+        """
+        if cls._cred_cache is not None:
+            return cls._cred_cache
+        # Imported here: only needed once per process, not for first paint
+        import json
+        import os
+
+        raw = None
+        try:
+            # O_NOFOLLOW: never read credentials through a planted symlink
+            fd = os.open(_CREDENTIALS_FILE, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+            with os.fdopen(fd, "rb") as f:
+                raw = f.read()
+            data = json.loads(raw)
+        except (OSError, ValueError):  # missing/unreadable file, bad JSON
+            data = {}
+        cls._cred_cache = _normalize_credentials(data)
+        cls._cred_cache_bytes = raw
+        if isinstance(data, dict) and "password" in data:
+            cls._migrate_plaintext_password(data)
+        return cls._cred_cache
+
+    @classmethod
+    def _migrate_plaintext_password(cls, old: dict) -> None:
+        """Move an old-layout password into the keyring and off the disk.
+
+        The file is rewritten without it even when keyring is unavailable:
+        the password is then forgotten rather than left in plain text.
+        """
+        pwd = old.get("password")
+        kr = _get_keyring()
+        if kr and cls._cred_cache["users"] and isinstance(pwd, str) and pwd:
+            try:
+                kr.set_password(_KEYRING_SERVICE, cls._cred_cache["users"][0], pwd)
+            except kr.errors.KeyringError as e:
+                log.warning("Could not move saved password to keyring: %s", e)
+        cls._store_credentials(cls._cred_cache)
 
     def _load_saved_credentials(self):
+        data = self._read_credentials()
+        users = data["users"]
+        if users:
+            completer = QCompleter(users, self.user_in)
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+            completer.activated[str].connect(self._fill_saved_account)
+            self.user_in.setCompleter(completer)
+        idx = data["last_idx"]
+        if 0 <= idx < len(users):
+            self.user_in.setText(users[idx])
+            self._fill_saved_account(users[idx])
+
+    def _fill_saved_account(self, user: str) -> None:
+        """Fill password / role for *user* from the in-memory account list."""
+        data = LoginWindow._cred_cache or _normalize_credentials({})
         try:
-            with open("credentials.json", "r") as f:
-                data = json.load(f)
-                if data.get("remember_me", False):
-                    self.user_in.setText(data.get("username", ""))
-                    self.pass_in.setText(data.get("password", ""))
-                    self.remember_chk.setChecked(True)
-                    saved_role = data.get("role", "controller")
-                    if saved_role == "controller":
-                        self.role_combo.setCurrentIndex(0)
-                    elif saved_role == "target":
-                        self.role_combo.setCurrentIndex(1)
-        except:
-            pass
-
-    def _save_credentials(self):
-        if self.remember_chk.isChecked():
-            selected_role_text = self.role_combo.currentText().lower()
-            role_to_save = (
-                "controller" if selected_role_text == "controller" else "target"
-            )
-            data = {
-                "username": self.user_in.text(),
-                "password": self.pass_in.text(),
-                "role": role_to_save,
-                "remember_me": True,
-            }
+            idx = data["users"].index(user)
+        except ValueError:
+            return
+        kr = _get_keyring()
+        if kr:
             try:
-                with open("credentials.json", "w") as f:
-                    json.dump(data, f)
-            except:
-                pass
+                self.pass_in.setText(kr.get_password(_KEYRING_SERVICE, user) or "")
+            except kr.errors.KeyringError as e:
+                log.warning("Could not read saved password: %s", e)
+        self.remember_chk.setChecked(True)
+        saved_role = data["roles"][idx]
+        if self.role_combo is not None and saved_role in _VALID_ROLES:
+            self.role_combo.setCurrentText(saved_role.capitalize())
+
+    def _save_credentials(self, c: _Creds | None = None):
+        if c is None:
+            c = self._snapshot()
+        old = self._read_credentials()
+        users, roles = list(old["users"]), list(old["roles"])
+        user = c.user
+        try:
+            idx = users.index(user)
+        except ValueError:
+            idx = -1
+
+        if c.remember:
+            if idx < 0:
+                idx = len(users)
+                users.append(user)
+                roles.append("")
+            if c.role:  # keep the stored role when the form has no picker
+                roles[idx] = c.role
+            last_idx = idx
+            kr = _get_keyring()
+            if kr:
+                try:
+                    kr.set_password(_KEYRING_SERVICE, user, c.pwd)
+                except kr.errors.KeyringError as e:
+                    log.warning("Could not save password: %s", e)
         else:
+            if idx >= 0:  # forget this account, keep the others
+                del users[idx], roles[idx]
+                kr = _get_keyring()
+                if kr:
+                    try:
+                        kr.delete_password(_KEYRING_SERVICE, user)
+                    except kr.errors.KeyringError:
+                        pass  # nothing stored for this user
+            last_idx = -1
+
+        self._store_credentials(
+            {
+                "users": users,
+                "roles": roles,
+                "last_idx": last_idx,
+            }
+        )
+
+    @staticmethod
+    def _store_credentials(data: dict) -> None:
+        """Write *data* to the credentials file, or remove it when empty."""
+        import os
+
+        users = data["users"]
+        if not users:
+            if LoginWindow._cred_cache_bytes is None:
+                LoginWindow._cred_cache = data
+                return  # nothing on disk
             try:
-                os.remove("credentials.json")
-            except:
+                os.unlink(_CREDENTIALS_FILE)
+            except FileNotFoundError:
                 pass
+            except OSError as e:
+                log.warning("Could not remove saved credentials: %s", e)
+                return
+            LoginWindow._cred_cache = data
+            LoginWindow._cred_cache_bytes = None
+            return
+
+        import json
+        import tempfile
+
+        new_bytes = json.dumps(data).encode()
+        if new_bytes == LoginWindow._cred_cache_bytes:
+            return
+        try:
+            # Write a temp file next to the target and swap it in, so a
+            # crash mid-write never leaves a truncated credentials file.
+            fd, tmp_path = tempfile.mkstemp(dir=".", prefix=".cred.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(new_bytes)
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, _CREDENTIALS_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            LoginWindow._cred_cache = data
+            LoginWindow._cred_cache_bytes = new_bytes
+        except OSError as e:
+            log.warning("Could not save credentials: %s", e)
 
     # basic sanity checks
-    def _validate(self, ip: str, port: str, user: str) -> bool:
+    def _validate(self, c: _Creds) -> bool:
+        # Cheap emptiness checks first, the address format last
+        ip = c.ip
         if not ip:
             return self._err("Server IP / hostname required.")
-        if not re.match(r"^(\d{1,3}\.){3}\d{1,3}$", ip) and "." not in ip:
-            return self._err("Invalid IP / hostname.")
-        if not port:
-            return self._err("Port required.")
-        if not user:
+        # Also catches pasted text the validator only rated Intermediate
+        if not self.port_in.hasAcceptableInput():
+            return self._err("Port must be 1-65535.")
+        if not c.user:
             return self._err("Username required.")
+        # "." test first: a dotless name fails without the numeric scan
+        if "." not in ip or (ip.replace(".", "").isdigit() and not _is_ipv4(ip)):
+            return self._err("Invalid IP / hostname.")
         return True
 
     def _err(self, msg: str) -> bool:
@@ -298,10 +567,7 @@ class LoginWindow(QWidget):
     # ---------- theme-icon helper ----------
     def _update_theme_icon(self, theme_name: str) -> None:
         """Update moon / sun icon and tooltip according to current theme."""
-        if theme_name == "dark":
-            emoji, tip = "🌙", "Switch to Light Mode"
-        else:
-            emoji, tip = "☀️", "Switch to Dark Mode"
+        emoji, tip = _THEME_ICONS.get(theme_name, _THEME_ICONS["light"])
         self.theme_btn.setText(emoji)
         self.theme_btn.setToolTip(tip)
 
@@ -6,17 +6,22 @@ Signals
 -------
 register_attempt_signal(str username, str password, str confirm)
 toggle_theme_signal()
+back_to_login_signal()
+
+All signals are emitted on the GUI thread; receivers living there may
+connect with ``Qt.DirectConnection`` to skip the auto-connection check.
 """
 
+import hmac
 import logging
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
+    QFormLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QMessageBox,
     QPushButton,
     QVBoxLayout,
     QWidget,
@@ -24,14 +29,90 @@ from PyQt5.QtWidgets import (
 
 log = logging.getLogger(__name__)
 
+# Theme name -> (toggle button text, tooltip)
+_THEME_ICONS = {
+    "dark": ("🌙", "Switch to Light Mode"),
+    "light": ("☀️", "Switch to Dark Mode"),
+}
+
+_LOGO_PATH = "assets/icons/logo.png"
+_LOGO_SIZE = 160
+
+# Widget styles, matched by object name. They are set once on the window
+# so Qt parses a single sheet per RegistrationWindow instead of one per widget.
+_THEME_BTN_QSS = """
+QPushButton#theme_btn {
+    font-size: 24px;
+    padding: 5px;
+    border: none;
+    background: transparent;
+}
+QPushButton#theme_btn:hover {
+    background: rgba(0, 0, 0, 0.1);
+    border-radius: 4px;
+}
+"""
+_REG_BTN_QSS = """
+QPushButton#reg_btn {
+    background: #2ecc71;
+    color: white;
+    font-weight: bold;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+    font-size: 14px;  /* Larger font */
+}
+QPushButton#reg_btn:hover {
+    background: #27ae60;
+}
+QPushButton#reg_btn:pressed {
+    background: #219a52;
+}
+"""
+_BACK_BTN_QSS = """
+QPushButton#back_btn {
+    background: #3498db;
+    color: white;
+    font-weight: bold;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+    font-size: 14px;  /* Larger font */
+}
+QPushButton#back_btn:hover {
+    background: #2980b9;
+}
+QPushButton#back_btn:pressed {
+    background: #2472a4;
+}
+"""
+_ERR_LBL_QSS = """
+QLabel#err_lbl {
+    color: #e74c3c;
+}
+"""
+_REGWIN_QSS = _THEME_BTN_QSS + _REG_BTN_QSS + _BACK_BTN_QSS + _ERR_LBL_QSS
+
+
+def _logo_key(w: int, h: int) -> str:
+    return f"regwin/logo@{w}x{h}"
+
 
 class RegistrationWindow(QWidget):
     register_attempt_signal = pyqtSignal(str, str, str)
     toggle_theme_signal = pyqtSignal()
     back_to_login_signal = pyqtSignal()  # New signal for returning to login
 
+    # Bold, larger title font; resolved once and shared by every instance
+    _TITLE_FONT: QFont | None = None
+
     def __init__(self) -> None:
         super().__init__()
+        self._err_box = None  # QMessageBox, built on first error
+        # Set while a registration request is in flight; repeat clicks
+        # (e.g. a fast double-click) are dropped until the form is reset.
+        self._submit_pending = False
+        self._logo_requested = False
         self._build_ui()
 
     def closeEvent(self, event):
@@ -39,6 +120,14 @@ class RegistrationWindow(QWidget):
         self.back_to_login_signal.emit()
         event.accept()
 
+    def showEvent(self, event):
+        # The window is built at startup but often never shown, so the logo
+        # is only fetched the first time it actually appears.
+        if not self._logo_requested:
+            self._logo_requested = True
+            self._request_logo()
+        super().showEvent(event)
+
     # --------------------------------------------------
     def _build_ui(self) -> None:
         self.setWindowTitle("SCU Remote Desktop — Sign Up")
@@ -47,66 +136,48 @@ class RegistrationWindow(QWidget):
         # Theme toggle
         top = QHBoxLayout()
         top.addStretch()
-        self.theme_btn = QPushButton("🌙")
+        self.theme_btn = QPushButton()  # text set by _update_theme_icon
         self.theme_btn.setCursor(Qt.PointingHandCursor)
         self.theme_btn.setFlat(True)
-        self.theme_btn.setStyleSheet(
-            """
-            QPushButton { 
-                font-size: 24px; 
-                padding: 5px;
-                border: none;
-                background: transparent;
-            }
-            QPushButton:hover {
-                background: rgba(0, 0, 0, 0.1);
-                border-radius: 4px;
-            }
-        """
-        )
-        self.theme_btn.clicked.connect(self.toggle_theme_signal.emit)
+        self.theme_btn.setObjectName("theme_btn")
+        self.theme_btn.clicked.connect(self.toggle_theme_signal)
         top.addWidget(self.theme_btn)
         self._update_theme_icon("dark")  # Set default icon
 
         # Main body
         body = QVBoxLayout()
-        body.setContentsMargins(30, 0, 30, 30)
-        body.setSpacing(8)  # Reduce spacing between elements
-
-        logo = QLabel()
-        logo.setAlignment(Qt.AlignCenter)
-        pm = QPixmap("assets/icons/logo.png")
-        if not pm.isNull():
-            logo.setPixmap(
-                pm.scaled(
-                    160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )  # Larger logo
-            )
-        body.addWidget(logo)
+        # One uniform gap between sections instead of extra spacer items
+        body.setContentsMargins(30, 10, 30, 30)
+        body.setSpacing(12)
+
+        self.logo_lbl = QLabel()
+        self.logo_lbl.setAlignment(Qt.AlignCenter)
+        body.addWidget(self.logo_lbl)  # filled on first show
 
         title = QLabel("Create Account")
         title.setAlignment(Qt.AlignCenter)
-        font = title.font()
-        font.setPointSize(16)  # Larger title text
-        font.setBold(True)
-        title.setFont(font)
+        if RegistrationWindow._TITLE_FONT is None:
+            font = title.font()
+            font.setPointSize(16)  # Larger title text
+            font.setBold(True)
+            RegistrationWindow._TITLE_FONT = font
+        title.setFont(RegistrationWindow._TITLE_FONT)
         body.addWidget(title)
-        body.addSpacing(10)  # Reduced spacing
 
-        body.addWidget(QLabel("Username:"))
+        # Credentials: one form layout, labels stacked above their fields
         self.user_in = QLineEdit()
-        body.addWidget(self.user_in)
-
-        body.addWidget(QLabel("Password:"))
         self.pwd_in = QLineEdit()
         self.pwd_in.setEchoMode(QLineEdit.Password)
-        body.addWidget(self.pwd_in)
-
-        body.addWidget(QLabel("Confirm password:"))
         self.cpwd_in = QLineEdit()
         self.cpwd_in.setEchoMode(QLineEdit.Password)
-        body.addWidget(self.cpwd_in)
-        body.addSpacing(10)
+        form = QFormLayout()
+        form.setRowWrapPolicy(QFormLayout.WrapAllRows)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.setSpacing(8)  # keep each label close to its field
+        form.addRow("Username:", self.user_in)
+        form.addRow("Password:", self.pwd_in)
+        form.addRow("Confirm password:", self.cpwd_in)
+        body.addLayout(form)
 
         # Buttons container
         buttons_layout = QVBoxLayout()
@@ -114,59 +185,23 @@ class RegistrationWindow(QWidget):
 
         self.reg_btn = QPushButton("Create account")
         self.reg_btn.setMinimumHeight(40)  # Taller buttons
-        self.reg_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: #2ecc71;
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-size: 14px;  /* Larger font */
-            }
-            QPushButton:hover {
-                background: #27ae60;
-            }
-            QPushButton:pressed {
-                background: #219a52;
-            }
-        """
-        )
+        self.reg_btn.setObjectName("reg_btn")
         self.reg_btn.setDefault(True)
-        self.reg_btn.clicked.connect(self._on_register)
+        self.reg_btn.clicked.connect(self._on_register, Qt.DirectConnection)
         buttons_layout.addWidget(self.reg_btn)
 
         # Back to Login button
         self.back_btn = QPushButton("Back to Login")
         self.back_btn.setMinimumHeight(40)  # Taller buttons
-        self.back_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: #3498db;
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-size: 14px;  /* Larger font */
-            }
-            QPushButton:hover {
-                background: #2980b9;
-            }
-            QPushButton:pressed {
-                background: #2472a4;
-            }
-        """
-        )
-        self.back_btn.clicked.connect(self.back_to_login_signal.emit)
+        self.back_btn.setObjectName("back_btn")
+        self.back_btn.clicked.connect(self.back_to_login_signal)
         buttons_layout.addWidget(self.back_btn)
 
         body.addLayout(buttons_layout)
 
         self.err_lbl = QLabel("")
         self.err_lbl.setAlignment(Qt.AlignCenter)
-        self.err_lbl.setStyleSheet("color:#e74c3c;")
+        self.err_lbl.setObjectName("err_lbl")
         self.err_lbl.hide()
         body.addWidget(self.err_lbl)
 
@@ -174,10 +209,30 @@ class RegistrationWindow(QWidget):
         root.setContentsMargins(0, 5, 0, 0)
         root.addLayout(top)
         root.addLayout(body)
+        self.setStyleSheet(_REGWIN_QSS)
         self.user_in.setFocus()
 
+    def _request_logo(self) -> None:
+        # The small PNG is decoded once per process; later windows reuse
+        # the scaled pixmap from QPixmapCache.
+        key = _logo_key(_LOGO_SIZE, _LOGO_SIZE)
+        pm = QPixmapCache.find(key)
+        if pm is None:
+            pm = QPixmap(_LOGO_PATH)
+            if pm.isNull():
+                log.warning("Logo not found at %s", _LOGO_PATH)
+                return
+            pm = pm.scaled(
+                _LOGO_SIZE, _LOGO_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            QPixmapCache.insert(key, pm)
+        self.logo_lbl.setPixmap(pm)
+
     # --------------------------------------------------
+    @pyqtSlot()
     def _on_register(self) -> None:
+        if self._submit_pending:
+            return
         usr, pwd, cpwd = (
             self.user_in.text().strip(),
             self.pwd_in.text(),
@@ -188,34 +243,44 @@ class RegistrationWindow(QWidget):
             return self._err("Username required.")
         if not pwd:
             return self._err("Password required.")
-        if pwd != cpwd:
+        # Length first (cheap, and the usual typo case); then a constant-time
+        # compare. Encoded because compare_digest only takes ASCII str.
+        if len(pwd) != len(cpwd) or not hmac.compare_digest(
+            pwd.encode(), cpwd.encode()
+        ):
             return self._err("Passwords do not match.")
 
         self.err_lbl.hide()
+        self._submit_pending = True
         self.reg_btn.setEnabled(False)
         self.reg_btn.setText("Creating…")
         self.register_attempt_signal.emit(usr, pwd, cpwd)
 
     def _err(self, msg: str) -> bool:
-        self.err_lbl.setText(msg)
-        self.err_lbl.show()
+        self._submit_pending = False  # any shown error ends the attempt
+        # Only touch the label when something changes (repeat submits with
+        # the same error would otherwise re-layout and repaint it)
+        if self.err_lbl.text() != msg:
+            self.err_lbl.setText(msg)
+        if self.err_lbl.isHidden():  # not isVisible(): window may be hidden
+            self.err_lbl.show()
         return False
 
     # ---------- theme-icon helper ----------
+    @pyqtSlot(str)
     def _update_theme_icon(self, theme_name: str) -> None:
         """Update moon / sun icon and tooltip according to current theme."""
-        if theme_name == "dark":
-            emoji, tip = "🌙", "Switch to Light Mode"
-        else:
-            emoji, tip = "☀️", "Switch to Dark Mode"
+        emoji, tip = _THEME_ICONS.get(theme_name, _THEME_ICONS["light"])
         self.theme_btn.setText(emoji)
         self.theme_btn.setToolTip(tip)
 
+    @pyqtSlot()
     def reset_form(self):
         self.user_in.clear()
         self.pwd_in.clear()
         self.cpwd_in.clear()
         self.err_lbl.hide()
+        self._submit_pending = False
         self.reg_btn.setEnabled(True)
         self.reg_btn.setText("Create account")
 
@@ -223,11 +288,16 @@ class RegistrationWindow(QWidget):
         """
         Show a critical error dialog with the given message.
         """
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Critical)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.exec_()
+        if self._err_box is None:
+            # Imported here: rarely needed, so kept off the import path
+            from PyQt5.QtWidgets import QMessageBox
+
+            self._err_box = QMessageBox(self)
+            self._err_box.setIcon(QMessageBox.Critical)
+        self._err_box.setWindowTitle(title)
+        self._err_box.setText(message)
+        self._err_box.exec_()
         # Reset the registration button state
+        self._submit_pending = False
         self.reg_btn.setEnabled(True)
         self.reg_btn.setText("Create account")
@@ -1,18 +1,14 @@
 """
 Target main window – includes ChatWidget and a simple permission dialog.
+
+Run from the project root with ``python -m client.ui_target``.
 """
 
 from __future__ import annotations
 
-import os
 import sys
-from pathlib import Path
-
-# Add project root directory to Python path
-project_root = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(project_root))
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -24,9 +20,6 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from client.target_client import TargetClient
-from client.widgets.chat_widget import ChatWidget
-
 
 class PermDialog(QDialog):
     def __init__(
@@ -57,8 +50,16 @@ class PermDialog(QDialog):
 
 
 class TargetWindow(QMainWindow):
+    # (sender, text, timestamp), emitted from the client's reader thread
+    chat_received = pyqtSignal(str, str, str)
+
     def __init__(self) -> None:
         super().__init__()
+        # Deferred so importing this module (e.g. to show a splash first)
+        # does not pull in the networking and chat modules.
+        from client.target_client import TargetClient
+        from client.widgets.chat_widget import ChatWidget
+
         self.setWindowTitle("Remote Target")
         self.resize(1100, 700)
 
@@ -75,12 +76,17 @@ class TargetWindow(QMainWindow):
         splitter.addWidget(self.chat)
 
         self.chat.send_signal.connect(self.client.send_chat)
-        self.client.on_chat(lambda u, m: self.chat.add_msg(u, m))
+        # Queued so the chat widget is only touched from the GUI thread
+        self.chat_received.connect(self._on_chat_received, Qt.QueuedConnection)
+        self.client.on_chat(self.chat_received.emit)
 
         # permission dialog callback
         self.client.on_perm_request(self._perm_dialog)
 
     # ------------------------------------------------------------------
+    def _on_chat_received(self, sender: str, text: str, _timestamp: str) -> None:
+        self.chat.add_msg(sender, text)
+
     def _perm_dialog(self, req: dict[str, bool], ctrl: str) -> dict[str, bool]:
         dlg = PermDialog(req, ctrl, self)
         if dlg.exec_() == QDialog.Accepted:
@@ -1,18 +1,70 @@
 # File: client/widgets/chat_widget.py
 """
 ChatAreaWidget (Advanced): A scrollable area that displays chat messages
-in a WhatsApp/Telegram-style layout using real QWidget-based bubbles.
+in a WhatsApp/Telegram-style layout using QLabel-based bubbles.
 Supports dark/light themes, RTL/LTR alignment, dynamic theme switching, and Persian-friendly font.
 """
 
-import re
+from collections import deque
+from html import escape as _esc
+
+from PyQt5.QtCore import QCoreApplication, QEvent, Qt, QTimer
+from PyQt5.QtWidgets import QLabel, QScrollArea, QVBoxLayout, QWidget
+
+# Bubbles kept on screen; older ones are dropped so long sessions do not
+# make every append (and every layout pass) slower.
+_MAX_BUBBLES = 1000
+
+# (background, text) colour per (theme, is_self).
+_BUBBLE_COLOURS = {
+    ("light", True): ("#DCF8C6", "#000000"),
+    ("light", False): ("#E4E6EB", "#000000"),
+    ("dark", True): ("#005C4B", "#FFFFFF"),
+    ("dark", False): ("#2F3136", "#E5E5E5"),
+}
+
+# Timestamp grey, readable on every bubble colour above, so the markup does
+# not depend on the theme and a theme switch needs no rebuild.
+_TIMESTAMP_COLOUR = "#8696A0"
+
+# The font family is picked here rather than with QLabel.setFont: the app
+# stylesheet's QWidget font-family rule would override a per-widget font on
+# the next polish. Living in the shared container sheet, it is resolved per
+# polish, not parsed from a stylesheet string per bubble.
+_BUBBLE_BASE_QSS = """
+QLabel#me, QLabel#other {
+    border-radius: 12px;
+    padding: 8px 12px;
+    max-width: 400px;
+}
+QLabel[rtl="true"] { font-family: Vazirmatn; }
+QLabel[rtl="false"] { font-family: "Segoe UI"; }
+"""
+
+
+def _theme_qss(theme: str) -> str:
+    me_bg, me_fg = _BUBBLE_COLOURS[(theme, True)]
+    other_bg, other_fg = _BUBBLE_COLOURS[(theme, False)]
+    return (
+        _BUBBLE_BASE_QSS
+        + f"QLabel#me {{ background-color: {me_bg}; color: {me_fg}; }}\n"
+        + f"QLabel#other {{ background-color: {other_bg}; color: {other_fg}; }}\n"
+    )
+
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QFontDatabase
-from PyQt5.QtWidgets import QHBoxLayout, QLabel, QScrollArea, QVBoxLayout, QWidget
+# Bubble look per theme, built once at import. Set on the ChatAreaWidget
+# container, so a theme switch is one setStyleSheet call rather than a
+# rebuild per bubble. Bubbles are named "me" / "other" and carry an "rtl"
+# property.
+_CHAT_QSS = {theme: _theme_qss(theme) for theme in ("light", "dark")}
 
 
-class ChatBubble(QWidget):
+def _is_rtl(message: str) -> bool:
+    """True when the message starts with an Arabic-block (U+0600–U+06FF) char."""
+    return bool(message) and 0x0600 <= ord(message[0]) <= 0x06FF
+
+
+class ChatBubble(QLabel):
     def __init__(self, sender, message, timestamp, is_self, theme):
         super().__init__()
         self.sender = sender
@@ -20,55 +72,34 @@ class ChatBubble(QWidget):
         self.timestamp = timestamp
         self.is_self = is_self
         self.theme = theme
-        self._build_ui()
-
-    def _build_ui(self):
-        # Remove previous layout if exists
-        old_layout = self.layout()
-        if old_layout is not None:
-            QWidget().setLayout(old_layout)
-
-        label = QLabel()
-        label.setText(
-            f"<b>{self.sender}</b><br>{self.message}<br><small>{self.timestamp}</small>"
-        )
-        label.setWordWrap(True)
-        label.setTextFormat(Qt.RichText)
-
-        is_rtl = bool(re.match(r"^[؀-ۿ]", self.message))
-        label.setAlignment(Qt.AlignRight if is_rtl else Qt.AlignLeft)
-        label.setLayoutDirection(Qt.RightToLeft if is_rtl else Qt.LeftToRight)
-
-        font_family = "Vazirmatn" if is_rtl else "Segoe UI"
-        label.setStyleSheet(f"font-family: {font_family};")
-
-        if self.theme == "light":
-            bg = "#DCF8C6" if self.is_self else "#E4E6EB"
-            fg = "#000000"
-        else:
-            bg = "#005C4B" if self.is_self else "#2F3136"
-            fg = "#FFFFFF" if self.is_self else "#E5E5E5"
-
-        label.setStyleSheet(
-            label.styleSheet()
-            + f"""
-            background-color: {bg};
-            color: {fg};
-            border-radius: 12px;
-            padding: 8px 12px;
-            max-width: 400px;
-        """
+        # Peer text is escaped so it is shown verbatim, not parsed as markup
+        body = _esc(self.message).replace("\n", "<br>")
+        self._html = (
+            f"<b>{_esc(self.sender)}</b><br>{body}<br>"
+            f'<small style="color:{_TIMESTAMP_COLOUR}">{_esc(self.timestamp)}</small>'
         )
-
-        layout = QHBoxLayout()
-        if self.is_self:
-            layout.addStretch()
-            layout.addWidget(label)
-        else:
-            layout.addWidget(label)
-            layout.addStretch()
-
-        self.setLayout(layout)
+        self._is_rtl = _is_rtl(self.message)
+        self._build_once()
+
+    def _build_once(self):
+        # The bubble is the label itself; ChatAreaWidget pushes it left or
+        # right with an alignment flag, so no per-bubble layout is needed.
+        self.setObjectName("me" if self.is_self else "other")
+        # One rich-text label keeps the bold sender and small, dimmed
+        # timestamp without a child widget per line.
+        self.setTextFormat(Qt.RichText)
+        self.setText(self._html)
+        self.setWordWrap(True)
+
+        is_rtl = self._is_rtl
+        self.setAlignment(Qt.AlignRight if is_rtl else Qt.AlignLeft)
+        self.setLayoutDirection(Qt.RightToLeft if is_rtl else Qt.LeftToRight)
+        self.setProperty("rtl", is_rtl)  # picks the font in _CHAT_QSS
+
+    def set_theme(self, theme):
+        # Colours come from the ChatAreaWidget container's stylesheet, so
+        # the bubble itself is left as it is.
+        self.theme = theme
 
 
 class ChatAreaWidget(QScrollArea):
@@ -78,19 +109,84 @@ class ChatAreaWidget(QScrollArea):
         self.setWidgetResizable(True)
 
         self.container = QWidget()
+        self.container.setStyleSheet(_CHAT_QSS.get(theme, _CHAT_QSS["dark"]))
         self.layout = QVBoxLayout(self.container)
         self.layout.addStretch()
         self.setWidget(self.container)
 
+        # Bubbles in display order, oldest first, capped at _MAX_BUBBLES
+        self._bubbles: deque[ChatBubble] = deque(maxlen=_MAX_BUBBLES)
+
+        # Messages arriving in a burst are queued and added in one pass,
+        # so the layout and scrollbar are updated once per frame at most.
+        self._pending = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)  # ~one frame
+        self._flush_timer.timeout.connect(self._flush_pending)
+        self._scroll_pending = False
+        self.verticalScrollBar().rangeChanged.connect(self._scroll_to_end)
+
     def append_message(self, sender, message, timestamp, is_self):
-        bubble = ChatBubble(sender, message, timestamp, is_self, self.theme)
-        self.layout.insertWidget(self.layout.count() - 1, bubble)
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        self._pending.append((sender, message, timestamp, is_self))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        if not self._pending:
+            return
+        self.container.setUpdatesEnabled(False)
+        try:
+            while self._pending:
+                sender, message, timestamp, is_self = self._pending.popleft()
+                bubble = ChatBubble(sender, message, timestamp, is_self, self.theme)
+                if len(self._bubbles) == _MAX_BUBBLES:
+                    old = self._bubbles.popleft()
+                    self.layout.removeWidget(old)
+                    old.deleteLater()
+                self.layout.insertWidget(
+                    self.layout.count() - 1,
+                    bubble,
+                    0,
+                    # Absolute, or an RTL bubble would mirror its own side
+                    Qt.AlignAbsolute | (Qt.AlignRight if is_self else Qt.AlignLeft),
+                )
+                self._bubbles.append(bubble)
+        finally:
+            self.container.setUpdatesEnabled(True)
+        self._request_scroll()
+
+    def _request_scroll(self):
+        # The scrollbar only learns the new height once Qt has run the
+        # deferred layout pass, so the scroll waits for that range change;
+        # every request made before then is served by the one call.
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(0, self._settle_scroll)
+
+    def _settle_scroll(self):
+        # Not every flush changes the range (content shorter than the view,
+        # or a capped history evicting a bubble as tall as the new one).
+        # Run this widget's own pending layout passes now; if they moved
+        # nothing, scroll regardless so the flag doesn't linger for an
+        # unrelated resize.
+        if not self._scroll_pending:
+            return
+        for obj in (self.container, self.viewport()):
+            QCoreApplication.sendPostedEvents(obj, QEvent.LayoutRequest)
+        if self._scroll_pending:
+            self._scroll_pending = False
+            bar = self.verticalScrollBar()
+            bar.setValue(bar.maximum())
+
+    def _scroll_to_end(self, _min=0, max_=0):
+        if self._scroll_pending:
+            self._scroll_pending = False
+            self.verticalScrollBar().setValue(max_)
 
     def update_theme(self, new_theme):
         self.theme = new_theme
-        for i in range(self.layout.count() - 1):
-            bubble = self.layout.itemAt(i).widget()
-            if hasattr(bubble, "theme"):
-                bubble.theme = new_theme
-                bubble._build_ui()
+        # Re-polishes every bubble against the new rules in one pass
+        self.container.setStyleSheet(_CHAT_QSS.get(new_theme, _CHAT_QSS["dark"]))
+        for bubble in self._bubbles:
+            bubble.set_theme(new_theme)
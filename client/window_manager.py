@@ -2,6 +2,7 @@
 
 import logging
 
+from PyQt5 import sip
 from PyQt5.QtCore import QObject, Qt, QThread, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
@@ -10,7 +11,6 @@ from PyQt5.QtWidgets import (
     QDialogButtonBox,
     QLabel,
     QMessageBox,
-    QToolBar,
     QVBoxLayout,
     QWidget,
 )
@@ -25,6 +25,40 @@ from client.ui_register import RegistrationWindow
 # Forward declaration for AppController type hinting if needed, though direct import is usually fine
 # class AppController: pass
 
+# Optional ControllerWindow hooks; probed once per window (see _mcw_caps)
+# rather than with hasattr on every network callback.
+_MCW_HOOKS = (
+    "display_frame",
+    "set_active_permissions",
+    "append_chat_message",
+    "chat_area",
+)
+
+
+# QMessageBox enums used by the message helpers, resolved once
+_ICON_INFO = QMessageBox.Information
+_ICON_WARN = QMessageBox.Warning
+_ICON_CRIT = QMessageBox.Critical
+_ICON_QUESTION = QMessageBox.Question
+_BTN_YES = QMessageBox.Yes
+_BTN_NO = QMessageBox.No
+
+# Answer to a declined access request; PermissionDialog only knows these keys.
+# Callers get a copy so the template is never mutated.
+_DENY_ALL = {"view": False, "mouse": False, "keyboard": False}
+
+
+def _drop_frame(_frame_bytes: bytes) -> None:
+    """Frame sink used while no controller view is showing."""
+
+
+def _connect_once(signal, slot, conn_type=Qt.AutoConnection) -> None:
+    """Connect ``slot`` unless it already is, so repeat wiring never doubles calls."""
+    try:
+        signal.connect(slot, conn_type | Qt.UniqueConnection)
+    except TypeError:  # PyQt: "connection is not unique"
+        pass
+
 
 class PermissionDialog(QDialog):
     def __init__(
@@ -34,26 +68,20 @@ class PermissionDialog(QDialog):
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
-        self.setWindowTitle(f"Access Request from {controller_username}")
         self.setModal(True)  # Ensure it's blocking
 
         layout = QVBoxLayout(self)
 
-        self.info_label = QLabel(
-            f"Controller '{controller_username}' is requesting the following permissions:"
-        )
+        self.info_label = QLabel()
         layout.addWidget(self.info_label)
 
         self.view_checkbox = QCheckBox("Allow screen viewing")
-        self.view_checkbox.setChecked(requested_permissions.get("view", False))
         layout.addWidget(self.view_checkbox)
 
         self.mouse_checkbox = QCheckBox("Allow mouse control")
-        self.mouse_checkbox.setChecked(requested_permissions.get("mouse", False))
         layout.addWidget(self.mouse_checkbox)
 
         self.keyboard_checkbox = QCheckBox("Allow keyboard control")
-        self.keyboard_checkbox.setChecked(requested_permissions.get("keyboard", False))
         layout.addWidget(self.keyboard_checkbox)
 
         self.button_box = QDialogButtonBox(
@@ -63,6 +91,18 @@ class PermissionDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box)
 
+        self.reset(controller_username, requested_permissions)
+
+    def reset(self, controller_username: str, requested_permissions: dict) -> None:
+        """Re-fill the dialog for a new request so one instance can be reused."""
+        self.setWindowTitle(f"Access Request from {controller_username}")
+        self.info_label.setText(
+            f"Controller '{controller_username}' is requesting the following permissions:"
+        )
+        self.view_checkbox.setChecked(requested_permissions.get("view", False))
+        self.mouse_checkbox.setChecked(requested_permissions.get("mouse", False))
+        self.keyboard_checkbox.setChecked(requested_permissions.get("keyboard", False))
+
     def get_granted_permissions(self) -> dict:
         return {
             "view": self.view_checkbox.isChecked(),
@@ -97,34 +137,59 @@ class WindowManager(QObject):
     admin_ui_delete_user_requested = pyqtSignal(int)
     admin_ui_fetch_logs_requested = pyqtSignal(int, int, str, str, str)
 
+    # (window signal, AppController slot) pairs wired by the connect_* methods
+    _COMMON_BINDINGS = (
+        ("send_chat_requested", "send_chat_message"),
+        ("switch_role_signal", "switch_role"),
+    )
+    _CONTROLLER_BINDINGS = (
+        ("connect_requested", "request_connection_to_target"),
+        ("permission_action_requested", "request_target_permissions"),
+        ("input_event_generated", "send_input_event_to_target"),
+    )
+    _TARGET_BINDINGS = (("frame_to_send_generated", "send_frame_to_controller"),)
+    _ADMIN_BINDINGS = (
+        ("fetch_users_requested", "admin_fetch_users"),
+        ("add_user_requested", "admin_add_user"),
+        ("edit_user_requested", "admin_edit_user"),
+        ("delete_user_requested", "admin_delete_user"),
+        ("fetch_logs_requested", "admin_fetch_logs"),
+    )
+
     def __init__(self, theme_manager):  # theme_manager is passed from main.py
         super().__init__()
         self._logger = logging.getLogger(__name__)
         self.theme_manager = theme_manager
         self.app_controller = None
+        # Looked up once; the QApplication outlives every WindowManager
+        self._app = QApplication.instance()
+        self._gui_thread = self._app.thread() if self._app else None
 
-        self.login_window = LoginWindow()
-        self.register_window = RegistrationWindow()
+        # Built on first show (see _ensure_login_window/_ensure_register_window)
+        self.login_window: LoginWindow | None = None
+        self.register_window: RegistrationWindow | None = None
         self.main_controller_window: ControllerWindow | None = None
         self.admin_window: AdminWindow | None = None  # New AdminWindow instance
-
-        # === Connect signals from initial windows ===
-        self.login_window.login_attempt_signal.connect(self.login_requested.emit)
-        self.login_window.register_signal.connect(self.show_registration_window)
-        self.login_window.toggle_theme_signal.connect(self.toggle_theme)
-
-        self.register_window.register_attempt_signal.connect(
-            self.registration_requested.emit
-        )
-        self.register_window.toggle_theme_signal.connect(self.toggle_theme)
-        self.register_window.back_to_login_signal.connect(self.show_login_window)  # Updated signal name
+        # Names from _MCW_HOOKS that main_controller_window provides
+        self._mcw_caps: frozenset[str] = frozenset()
+        # Per-frame target of display_remote_frame, bound when the window is built
+        self._display_frame = _drop_frame
+        # main_controller_window.update_peer_status, or None without a window
+        self._update_peer_status = None
+        # Non-blocking message boxes still on screen (see show_message)
+        self._open_messages: set[QMessageBox] = set()
+        # Reused for every blocking show_message; built on first use
+        self._msg_box: QMessageBox | None = None
+        # Reused for every access request; built on first use
+        self._perm_dialog: PermissionDialog | None = None
+        # Window currently shown to the user; parent for message boxes/dialogs
+        self._active_window: QWidget | None = None
 
         # Apply initial theme
-        app = QApplication.instance()
+        app = self._app
         if app:
             current_theme = self.theme_manager.get_current_theme()
             self.theme_manager.apply_theme(app, current_theme)
-            self._update_all_windows_theme_icons(current_theme)
         else:
             self._logger.error(
                 "QApplication instance not found during WindowManager init."
@@ -133,99 +198,145 @@ class WindowManager(QObject):
     def set_app_controller(self, app_controller):
         self.app_controller = app_controller
 
+    def _ensure_login_window(self) -> LoginWindow:
+        if self.login_window is None:
+            self.login_window = LoginWindow(with_role=True)
+            self.login_window.login_attempt_signal.connect(self.login_requested.emit)
+            self.login_window.register_signal.connect(self.show_registration_window)
+            self.login_window.toggle_theme_signal.connect(self.toggle_theme)
+        return self.login_window
+
+    def _ensure_register_window(self) -> RegistrationWindow:
+        if self.register_window is None:
+            self.register_window = RegistrationWindow()
+            self.register_window.register_attempt_signal.connect(
+                self.registration_requested.emit, Qt.DirectConnection
+            )
+            self.register_window.toggle_theme_signal.connect(self.toggle_theme)
+            self.register_window.back_to_login_signal.connect(self.show_login_window)
+        return self.register_window
+
     def _update_all_windows_theme_icons(self, theme_name: str):
-        """Update theme icons for all managed windows."""
-        for win in (
-            self.login_window,
-            self.register_window,
-            self.main_controller_window,
-            self.admin_window,  # Include admin window
-        ):
-            if win and hasattr(win, "_update_theme_icon"):
-                win._update_theme_icon(theme_name)
-            elif win and hasattr(win, "theme_btn"):
-                icon_text = "☀️" if theme_name == "light" else "🌙"
-                win.theme_btn.setText(icon_text)
-
-    def _apply_theme_to_specific_elements(self, theme_name: str):
-        """Apply theme-specific stylesheets to elements like toolbars, checkboxes after main QSS is loaded."""
-        # This method might need to be more generic or duplicated for admin_window if its elements differ
-        active_window = self.main_controller_window or self.admin_window
-        if active_window:
-            toolbar = active_window.findChild(QToolBar)
-            if toolbar:
-                if theme_name == "light":
-                    toolbar.setStyleSheet(
-                        "QToolBar { background-color: #e0e0e0; border-bottom: 1px solid #c0c0c0; }"
-                    )
-                else:
-                    toolbar.setStyleSheet(
-                        "QToolBar { background-color: #333333; border-bottom: 1px solid #222222; }"
-                    )
-        # Login window checkbox (remains the same)
-        if self.login_window and hasattr(self.login_window, "remember_chk"):
-            base_style = "QCheckBox::indicator {{ width: 20px; height: 20px; border-radius: 3px; }}"
-            if theme_name == "light":
-                self.login_window.remember_chk.setStyleSheet(
-                    base_style
-                    + "QCheckBox::indicator { border: 1px solid #74b9ff; background: #ffffff; }"
-                    + "QCheckBox::indicator:checked { background-image: url(assets/icons/checkmark.svg); background-position: center; background-repeat: no-repeat; border-color: #74b9ff; }"
-                )
-            else:  # Dark theme
-                self.login_window.remember_chk.setStyleSheet(
-                    base_style
-                    + "QCheckBox::indicator { border: 1px solid #3d4852; background: #2d3436; }"
-                    + "QCheckBox::indicator:checked { background-image: url(assets/icons/checkmark.svg); background-position: center; background-repeat: no-repeat; border-color: #0984e3; }"
-                )
+        """Update theme icons for the managed windows that are on screen.
+
+        Hidden windows are brought up to date by the show_* methods instead.
+        """
+        for win in self._visible_windows():
+            win._update_theme_icon(theme_name)
+
+    def _visible_windows(self) -> list:
+        """The managed top-level windows currently on screen."""
+        return [
+            win
+            for win in (
+                self.login_window,
+                self.register_window,
+                self.main_controller_window,
+                self.admin_window,
+            )
+            if win is not None and win.isVisible()
+        ]
 
     def toggle_theme(self):
         current = self.theme_manager.get_current_theme()
         next_theme = "light" if current == "dark" else "dark"
-        app = QApplication.instance()
+        app = self._app
         if app:
-            self.theme_manager.apply_theme(app, next_theme)
-            self._update_all_windows_theme_icons(next_theme)
-            self._apply_theme_to_specific_elements(next_theme)
-
-            active_chat_area = None
-            if self.main_controller_window and hasattr(
-                self.main_controller_window, "chat_area"
-            ):
-                active_chat_area = self.main_controller_window.chat_area
-            # Add similar check for admin_window if it has a chat area
-            # elif self.admin_window and hasattr(self.admin_window, "some_chat_area_attribute"):
-            #     active_chat_area = self.admin_window.some_chat_area_attribute
-
-            if active_chat_area and hasattr(active_chat_area, "update_theme"):
-                active_chat_area.update_theme(next_theme)
+            # Hold painting on the visible windows so the stylesheet, icon and
+            # chat restyles land in one repaint instead of one each
+            frozen = self._visible_windows()
+            for win in frozen:
+                win.setUpdatesEnabled(False)
+            try:
+                self.theme_manager.apply_theme(app, next_theme)
+                self._update_all_windows_theme_icons(next_theme)
+
+                active_chat_area = None
+                if self.main_controller_window and hasattr(
+                    self.main_controller_window, "chat_area"
+                ):
+                    active_chat_area = self.main_controller_window.chat_area
+                # Add similar check for admin_window if it has a chat area
+                # elif self.admin_window and hasattr(self.admin_window, "some_chat_area_attribute"):
+                #     active_chat_area = self.admin_window.some_chat_area_attribute
+
+                if active_chat_area and hasattr(active_chat_area, "update_theme"):
+                    active_chat_area.update_theme(next_theme)
+            finally:
+                for win in frozen:
+                    win.setUpdatesEnabled(True)
 
         self._logger.info(f"Theme switched to {next_theme}")
 
+    def _close_window(self, window) -> None:
+        """Close a main/admin window without it asking to log out again."""
+        try:
+            window.logout_signal.disconnect()
+        except TypeError:  # nothing connected
+            pass
+        self._close_dialogs_of(window)
+        window.close()
+
+    def _close_dialogs_of(self, window) -> None:
+        """Close message boxes and the permission dialog owned by ``window``.
+
+        They would otherwise stay on screen over a window that is going away.
+        The shared blocking box and permission dialog are detached rather
+        than destroyed.
+        """
+        for box in [b for b in self._open_messages if b.parent() is window]:
+            box.close()  # WA_DeleteOnClose; drops out via destroyed
+        box = self._msg_box
+        if box is not None and not sip.isdeleted(box) and box.parent() is window:
+            if box.isVisible():
+                box.done(QMessageBox.Cancel)  # let a pending exec_() return
+            box.setParent(None, Qt.Dialog)  # keep the shared box for reuse
+        dialog = self._perm_dialog
+        if dialog is not None and not sip.isdeleted(dialog):
+            if dialog.parent() is window:
+                if dialog.isVisible():
+                    dialog.reject()
+                # Detach so it survives the window it was shown over
+                dialog.setParent(None, Qt.Dialog)
+
     def show_login_window(self):
         self._logger.info("Displaying login window")
         if self.main_controller_window:
-            self.main_controller_window.close()
+            self._close_window(self.main_controller_window)
             self.main_controller_window = None
+            self._display_frame = _drop_frame
+            self._update_peer_status = None
         if self.register_window:
             self.register_window.hide()
         if self.admin_window:  # Close admin window if open
-            self.admin_window.close()
+            self._close_window(self.admin_window)
             self.admin_window = None
-        self.login_window.show()
-        self.login_window.activateWindow()
-        self.login_window.raise_()
+        login_window = self._ensure_login_window()
+        login_window._update_theme_icon(self.theme_manager.get_current_theme())
+        login_window.show()
+        login_window.activateWindow()
+        login_window.raise_()
+        self._active_window = login_window
 
     def show_registration_window(self):
         self._logger.info("Displaying registration window")
-        self.login_window.hide()
-        self.register_window.show()
-        self.register_window.activateWindow()
-        self.register_window.raise_()
+        if self.login_window:
+            self.login_window.hide()
+        register_window = self._ensure_register_window()
+        register_window._update_theme_icon(self.theme_manager.get_current_theme())
+        register_window.show()
+        register_window.activateWindow()
+        register_window.raise_()
+        self._active_window = register_window
 
     def close_registration_window_on_success(self):
         self._logger.info("Closing registration window after successful registration")
+        if not self.register_window:
+            return
         self.register_window.reset_form()
         self.register_window.hide()
+        if self._active_window is self.register_window:
+            self._active_window = None
 
     def show_main_window_for_role(self, username: str, user_id: int, role: str):
         self._logger.info(
@@ -236,38 +347,40 @@ class WindowManager(QObject):
         if self.register_window:
             self.register_window.hide()
         if self.admin_window:  # Close admin window if it was open
-            self.admin_window.close()
+            self._close_window(self.admin_window)
             self.admin_window = None
 
         if self.main_controller_window:
-            self.main_controller_window.close()
+            self._close_window(self.main_controller_window)
 
         self.main_controller_window = ControllerWindow(
             username=username, user_id=user_id, role=role
         )
+        mcw = self.main_controller_window
+        self._mcw_caps = frozenset(name for name in _MCW_HOOKS if hasattr(mcw, name))
+        if role == "controller" and "display_frame" in self._mcw_caps:
+            self._display_frame = mcw.display_frame
+        else:
+            self._display_frame = _drop_frame
+        self._update_peer_status = getattr(mcw, "update_peer_status", None)
 
         if hasattr(self.main_controller_window, "logout_signal"):
             self.main_controller_window.logout_signal.connect(
                 self._confirm_logout  # Connect to general logout confirmation
             )
         if hasattr(self.main_controller_window, "toggle_theme_signal"):
-            self.main_controller_window.toggle_theme_signal.connect(self.toggle_theme)
+            _connect_once(
+                self.main_controller_window.toggle_theme_signal,
+                self.toggle_theme,
+                Qt.DirectConnection,
+            )
 
         current_theme = self.theme_manager.get_current_theme()
-        self._update_all_windows_theme_icons(current_theme)
-        self._apply_theme_to_specific_elements(current_theme)
-        if hasattr(self.main_controller_window, "chat_area") and hasattr(
-            self.main_controller_window.chat_area, "update_theme"
-        ):
-            self.main_controller_window.chat_area.update_theme(current_theme)
-
-        # Initialize UI event timers
-        if hasattr(self.main_controller_window, "_timer"):
-            self.main_controller_window._timer.start()
-        if hasattr(self.main_controller_window, "_bandwidth_timer"):
-            self.main_controller_window._bandwidth_timer.start()
-
+        self.main_controller_window._update_theme_icon(current_theme)
+        self.main_controller_window.chat_area.update_theme(current_theme)
+        # Session and bandwidth timers start in ControllerWindow.showEvent
         self.main_controller_window.show()
+        self._active_window = self.main_controller_window
 
     def show_admin_window(self, username: str):
         """Show the admin panel."""
@@ -277,11 +390,13 @@ class WindowManager(QObject):
         if self.register_window:
             self.register_window.hide()
         if self.main_controller_window:  # Close main window if it was open
-            self.main_controller_window.close()
+            self._close_window(self.main_controller_window)
             self.main_controller_window = None
+            self._display_frame = _drop_frame
+            self._update_peer_status = None
 
         if self.admin_window:  # Close existing if any
-            self.admin_window.close()
+            self._close_window(self.admin_window)
 
         self.admin_window = AdminWindow(username=username)
 
@@ -291,13 +406,27 @@ class WindowManager(QObject):
                 self._confirm_logout  # Admin also confirms logout
             )
         if hasattr(self.admin_window, "toggle_theme_signal"):
-            self.admin_window.toggle_theme_signal.connect(self.toggle_theme)
+            _connect_once(
+                self.admin_window.toggle_theme_signal,
+                self.toggle_theme,
+                Qt.DirectConnection,
+            )
 
-        current_theme = self.theme_manager.get_current_theme()
-        self._update_all_windows_theme_icons(current_theme)
-        self._apply_theme_to_specific_elements(current_theme)
+        self.admin_window._update_theme_icon(self.theme_manager.get_current_theme())
 
         self.admin_window.show()
+        self._active_window = self.admin_window
+
+    def _bind(self, window, bindings) -> None:
+        """Connect ``window`` signals to AppController slots by name.
+
+        Pairs whose signal or slot is missing are skipped.
+        """
+        for signal_name, slot_name in bindings:
+            signal = getattr(window, signal_name, None)
+            slot = getattr(self.app_controller, slot_name, None)
+            if signal is not None and slot is not None:
+                _connect_once(signal, slot)
 
     def connect_admin_window_signals(self, app_controller):
         """Connect signals from AdminWindow to AppController."""
@@ -308,20 +437,7 @@ class WindowManager(QObject):
             )
             return
 
-        self.admin_window.fetch_users_requested.connect(
-            self.app_controller.admin_fetch_users
-        )
-        self.admin_window.add_user_requested.connect(self.app_controller.admin_add_user)
-        self.admin_window.edit_user_requested.connect(
-            self.app_controller.admin_edit_user
-        )
-        self.admin_window.delete_user_requested.connect(
-            self.app_controller.admin_delete_user
-        )
-        self.admin_window.fetch_logs_requested.connect(
-            self.app_controller.admin_fetch_logs
-        )
-
+        self._bind(self.admin_window, self._ADMIN_BINDINGS)
         self._logger.info("Admin window signals connected.")
 
     def connect_main_window_signals(self, app_controller):
@@ -332,75 +448,36 @@ class WindowManager(QObject):
             )
             return
 
-        if hasattr(self.main_controller_window, "send_chat_requested") and hasattr(
-            self.app_controller, "send_chat_message"
-        ):
-            self.main_controller_window.send_chat_requested.connect(
-                self.app_controller.send_chat_message
-            )
-
-        if hasattr(self.main_controller_window, "switch_role_signal") and hasattr(
-            self.app_controller, "switch_role"
-        ):
-            self.main_controller_window.switch_role_signal.connect(
-                self.app_controller.switch_role
-            )
-
-        role = self.main_controller_window.role
+        mcw = self.main_controller_window
+        role = mcw.role
+        self._bind(mcw, self._COMMON_BINDINGS)
         if role == "controller":
-            if hasattr(self.main_controller_window, "connect_requested") and hasattr(
-                self.app_controller, "request_connection_to_target"
-            ):
-                self.main_controller_window.connect_requested.connect(
-                    self.app_controller.request_connection_to_target
-                )
-            if hasattr(
-                self.main_controller_window, "permission_action_requested"
-            ) and hasattr(self.app_controller, "request_target_permissions"):
-                self.main_controller_window.permission_action_requested.connect(
-                    self.app_controller.request_target_permissions
-                )
-            if hasattr(
-                self.main_controller_window, "input_event_generated"
-            ) and hasattr(self.app_controller, "send_input_event_to_target"):
-                self.main_controller_window.input_event_generated.connect(
-                    self.app_controller.send_input_event_to_target
-                )
+            self._bind(mcw, self._CONTROLLER_BINDINGS)
         elif role == "target":
-            if hasattr(
-                self.main_controller_window, "frame_to_send_generated"
-            ) and hasattr(self.app_controller, "send_frame_to_controller"):
-                self.main_controller_window.frame_to_send_generated.connect(
-                    self.app_controller.send_frame_to_controller
-                )
+            self._bind(mcw, self._TARGET_BINDINGS)
         self._logger.info(f"Main window signals connected for role: {role}")
 
     # --- AppController Signal Handlers ---
     def display_chat_message(self, sender: str, text: str, timestamp: str):
-        active_window = (
-            self.main_controller_window or self.admin_window
-        )  # Admin might have chat later
-        if active_window and hasattr(active_window, "append_chat_message"):
-            active_window.append_chat_message(sender, text, timestamp)
-        elif (
-            active_window
-            and hasattr(active_window, "chat_area")
-            and hasattr(active_window.chat_area, "append_message")
-        ):
+        # Only ControllerWindow has a chat pane (admin might have chat later)
+        mcw = self.main_controller_window
+        if not mcw:
+            return
+        if "append_chat_message" in self._mcw_caps:
+            mcw.append_chat_message(sender, text, timestamp)
+        elif "chat_area" in self._mcw_caps:
             # For ControllerWindow using ChatAreaWidget
-            active_window.chat_area.append_message(
-                sender, text, timestamp, sender == active_window.username
+            mcw.chat_area.append_message(
+                sender, text, timestamp, sender == mcw.username
             )
 
     def show_general_error(self, code: int, reason: str):
         title = f"Error (Code: {code})" if code != 0 else "Error"
-        self.show_message(reason, title=title, icon=QMessageBox.Critical)
+        self.show_message(reason, title=title, icon=_ICON_CRIT, blocking=True)
 
     def update_connection_status(self, peer_username: str, session_id: int):
-        if self.main_controller_window and hasattr(
-            self.main_controller_window, "update_peer_status"
-        ):
-            self.main_controller_window.update_peer_status(
+        if self._update_peer_status:
+            self._update_peer_status(
                 connected=True, peer_username=peer_username, session_id=session_id
             )
         self.show_message(
@@ -409,10 +486,8 @@ class WindowManager(QObject):
         )
 
     def update_session_ended_status(self):  # Add self parameter
-        if self.main_controller_window and hasattr(
-            self.main_controller_window, "update_peer_status"
-        ):
-            self.main_controller_window.update_peer_status(connected=False)
+        if self._update_peer_status:
+            self._update_peer_status(connected=False)
         self.show_message("Session has ended.", "Session Ended")
 
     def update_controller_permissions(self, granted_permissions: dict):
@@ -420,19 +495,22 @@ class WindowManager(QObject):
             self.main_controller_window
             and self.main_controller_window.role == "controller"
         ):
-            if hasattr(self.main_controller_window, "set_active_permissions"):
+            if "set_active_permissions" in self._mcw_caps:
                 self.main_controller_window.set_active_permissions(granted_permissions)
             self.show_message(
                 f"Permissions updated: {granted_permissions}", "Permissions"
             )
 
-    def display_remote_frame(self, frame_bytes: bytes):
+    def update_network_rtt(self, rtt_ms: int):
         if (
             self.main_controller_window
             and self.main_controller_window.role == "controller"
         ):
-            if hasattr(self.main_controller_window, "display_frame"):
-                self.main_controller_window.display_frame(frame_bytes)
+            self.main_controller_window.set_network_rtt(rtt_ms)
+
+    def display_remote_frame(self, frame_bytes: bytes):
+        # Hot path (one call per video frame): no lookups, just the bound sink
+        self._display_frame(frame_bytes)
 
     # --- Admin Panel Slots (called by AppController signals) ---
     def update_admin_user_list(self, users: list):
@@ -453,35 +531,72 @@ class WindowManager(QObject):
 
     # --- Utility/Error Methods ---
     def show_message(
-        self, message: str, title: str = "Info", icon=QMessageBox.Information
+        self,
+        message: str,
+        title: str = "Info",
+        icon=_ICON_INFO,
+        blocking: bool = False,
     ):
-        active_parent = (
-            self.main_controller_window
-            or self.admin_window
-            or self.login_window
-            or QApplication.activeWindow()
-        )
+        """Pop up a message box.
+
+        Non-blocking boxes are shown and left to close themselves, so frames
+        and chat keep flowing; ``blocking`` runs a nested event loop as before
+        and is kept for errors the user must acknowledge.
+        """
+        active_parent = self._active_window or QApplication.activeWindow()
         if (
             title == "Session Ended"
             and self.main_controller_window is None
             and self.admin_window is None
         ):
             return
-        msg_box = QMessageBox(active_parent)
+        if blocking:
+            msg_box = self._blocking_message_box(active_parent)
+        else:
+            msg_box = QMessageBox(active_parent)
         msg_box.setIcon(icon)
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.exec_()
+        if blocking:
+            msg_box.exec_()
+            return
+        msg_box.setAttribute(Qt.WA_DeleteOnClose)
+        # A parentless box would be collected as soon as this returns.
+        # Dropped on destroyed, which also fires if its parent goes first.
+        self._open_messages.add(msg_box)
+        msg_box.destroyed.connect(
+            lambda _obj=None, box=msg_box: self._open_messages.discard(box)
+        )
+        msg_box.show()
+
+    def _blocking_message_box(self, parent) -> QMessageBox:
+        """The shared box for blocking messages, parented to ``parent``.
+
+        Only one blocking box can be waited on at a time, so one instance is
+        reconfigured per message; a message raised while it is already up
+        (from inside its exec_ loop) gets a box of its own.
+        """
+        box = self._msg_box
+        if box is not None and not sip.isdeleted(box):
+            if box.isVisible():
+                return QMessageBox(parent)
+            if box.parent() is not parent:
+                box.setParent(parent, Qt.Dialog)
+            return box
+        self._msg_box = QMessageBox(parent)
+        return self._msg_box
 
     def show_login_error(self, message: str, title: str = "Login Error"):
-        if self.login_window:
-            if hasattr(self.login_window, "_err"):
-                self.login_window._err(message)
-            elif hasattr(self.login_window, "err_lbl"):
-                self.login_window.err_lbl.setText(message)
-                self.login_window.err_lbl.show()
-            else:
-                self.show_message(message, title=title, icon=QMessageBox.Critical)
+        login_window = self._ensure_login_window()
+        if hasattr(login_window, "_err"):
+            login_window._err(message)
+        elif hasattr(login_window, "err_lbl"):
+            login_window.err_lbl.setText(message)
+            login_window.err_lbl.show()
+        else:
+            self.show_message(
+                message, title=title, icon=_ICON_CRIT, blocking=True
+            )
 
     def show_registration_error(self, message: str):
         if self.register_window:
@@ -497,55 +612,59 @@ class WindowManager(QObject):
     def show_chat_error(
         self, message: str = "Failed to send message. Please try again."
     ):
-        self.show_message(message, title="Chat Error", icon=QMessageBox.Warning)
+        self.show_message(message, title="Chat Error", icon=_ICON_WARN)
 
     def handle_show_permission_dialog_request(
         self, controller_username: str, requested_permissions: dict
     ):
-        if QApplication.instance().thread() != QThread.currentThread():
+        if self._gui_thread != QThread.currentThread():
             self._logger.error(
                 "CRITICAL: handle_show_permission_dialog_request called from non-main thread!"
             )
             pass  # Fallback handled in AppController with QueuedConnection assumption.
 
         self._logger.info(
-            f"Attempting to create PermissionDialog for {controller_username} on thread: {QApplication.instance().thread().currentThreadId()}"
-        )
-        active_parent = (
-            self.main_controller_window
-            or self.admin_window
-            or QApplication.activeWindow()
-        )
-        dialog = PermissionDialog(
-            controller_username,
-            requested_permissions,
-            active_parent,
+            f"Attempting to create PermissionDialog for {controller_username} on thread: {QThread.currentThreadId()}"
         )
+        dialog = self._permission_dialog(controller_username, requested_permissions)
         dialog.setWindowModality(Qt.ApplicationModal)
 
         granted_permissions: dict
         if dialog.exec_() == QDialog.Accepted:
             granted_permissions = dialog.get_granted_permissions()
         else:
-            granted_permissions = {key: False for key in requested_permissions}
+            granted_permissions = _DENY_ALL.copy()
 
         self.permission_dialog_response_ready.emit(granted_permissions)
 
     def show_permission_dialog(
         self, controller_username: str, requested_permissions: dict
     ) -> dict:
-        active_parent = (
-            self.main_controller_window
-            or self.admin_window
-            or QApplication.activeWindow()
-        )
-        dialog = PermissionDialog(
-            controller_username, requested_permissions, active_parent
-        )
+        dialog = self._permission_dialog(controller_username, requested_permissions)
         if dialog.exec_() == QDialog.Accepted:
             return dialog.get_granted_permissions()
         else:
-            return {key: False for key in requested_permissions}
+            return _DENY_ALL.copy()
+
+    def _permission_dialog(
+        self, controller_username: str, requested_permissions: dict
+    ) -> PermissionDialog:
+        """The shared PermissionDialog, reset for this request and parented
+        to the window in front."""
+        active_parent = self._active_window or QApplication.activeWindow()
+        dialog = self._perm_dialog
+        # A dialog parented to a window that has since been destroyed goes
+        # with it, so rebuild in that case.
+        if dialog is None or sip.isdeleted(dialog):
+            dialog = PermissionDialog(
+                controller_username, requested_permissions, active_parent
+            )
+            self._perm_dialog = dialog
+            return dialog
+        if dialog.parent() is not active_parent:
+            dialog.setParent(active_parent, Qt.Dialog)
+        dialog.reset(controller_username, requested_permissions)
+        return dialog
 
     def _confirm_logout(self):
         active_window = self.main_controller_window or self.admin_window
@@ -556,13 +675,13 @@ class WindowManager(QObject):
             return
 
         msg_box = QMessageBox(active_window)
-        msg_box.setIcon(QMessageBox.Question)
+        msg_box.setIcon(_ICON_QUESTION)
         msg_box.setWindowTitle("Confirm Logout")
         msg_box.setText("Are you sure you want to log out?")
-        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg_box.setDefaultButton(QMessageBox.No)
+        msg_box.setStandardButtons(_BTN_YES | _BTN_NO)
+        msg_box.setDefaultButton(_BTN_NO)
 
-        if msg_box.exec_() == QMessageBox.Yes:
+        if msg_box.exec_() == _BTN_YES:
             self._logger.info("User confirmed logout")
             if self.app_controller:  # Ensure app_controller exists
                 self.app_controller.handle_logout()  # AppController will emit logout_complete
@@ -572,10 +691,13 @@ class WindowManager(QObject):
     def handle_app_controller_logout(
         self,
     ):  # This is connected to AppController.logout_complete
+        self._active_window = None
         if self.main_controller_window:
-            self.main_controller_window.close()
+            self._close_window(self.main_controller_window)
             self.main_controller_window = None
+            self._display_frame = _drop_frame
+            self._update_peer_status = None
         if self.admin_window:  # Also close admin window on logout
-            self.admin_window.close()
+            self._close_window(self.admin_window)
             self.admin_window = None
         self.show_login_window()
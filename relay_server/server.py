@@ -11,7 +11,7 @@ from typing import Any, Dict, Optional
 
 from relay_server.database import Database
 from relay_server.logger import get_logger
-from shared.protocol import PacketType, recv, send_json
+from shared.protocol import PacketType, recv, send_bytes, send_json
 
 # Global database and logger instances
 db = Database("relay.db")  # Or use a configurable path
@@ -46,6 +46,19 @@ class ClientConnection:
         default_factory=lambda: {"view": False, "mouse": False, "keyboard": False}
     )
 
+    # Handler threads of both peers write to this socket (frames, chat and
+    # the owner's own replies); a packet must go out whole before the next
+    # starts, so every write after auth takes this lock.
+    send_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def send_json(self, pkt_type: PacketType, data: Any) -> None:
+        with self.send_lock:
+            send_json(self.sock, pkt_type, data)
+
+    def send_bytes(self, pkt_type: PacketType, data: bytes) -> None:
+        with self.send_lock:
+            send_bytes(self.sock, pkt_type, data)
+
 
 class RelayHandler(StreamRequestHandler):
     """
@@ -166,8 +179,8 @@ class RelayHandler(StreamRequestHandler):
             )
             self.server.active_clients[username] = self.client_info
 
-        send_json(
-            self.request, PacketType.AUTH_OK, {"user_id": user_id, "username": username}
+        self.client_info.send_json(
+            PacketType.AUTH_OK, {"user_id": user_id, "username": username}
         )
         logger.info(
             f"[AUTH_OK] User {username} ({role}) authenticated from {self.client_address}"
@@ -202,8 +215,7 @@ class RelayHandler(StreamRequestHandler):
             logger.warning(
                 f"[CONNECT_DENIED] User {self.client_info.username} (not controller) sent CONNECT_REQUEST."
             )
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 403, "reason": "Only controllers can send CONNECT_REQUEST"},
             )
@@ -211,8 +223,7 @@ class RelayHandler(StreamRequestHandler):
 
         target_identifier = data.get("target_identifier")
         if not target_identifier:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 400, "reason": "target_identifier missing"},
             )
@@ -245,8 +256,7 @@ class RelayHandler(StreamRequestHandler):
             logger.info(
                 f"[CONNECT_FAIL] Controller {controller_info.username} request for target {target_identifier}: Target not found or not a target."
             )
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 404, "reason": "Target not found or invalid role"},
             )
@@ -256,8 +266,7 @@ class RelayHandler(StreamRequestHandler):
             logger.info(
                 f"[CONNECT_FAIL] Controller {controller_info.username} request for target {target_identifier}: Target already in a session."
             )
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 409, "reason": "Target is busy"},
             )  # Conflict
@@ -269,8 +278,7 @@ class RelayHandler(StreamRequestHandler):
             logger.error(
                 f"[DB_ERROR] Failed to open session for {controller_info.username} and {target_info.username}"
             )
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 500, "reason": "Failed to create session"},
             )
@@ -295,13 +303,11 @@ class RelayHandler(StreamRequestHandler):
             "role": "target",
         }
 
-        send_json(
-            controller_info.sock,
+        controller_info.send_json(
             PacketType.CONNECT_INFO,
             connect_info_payload_for_controller,
         )
-        send_json(
-            target_info.sock, 
+        target_info.send_json(
             PacketType.CONNECT_INFO, 
             connect_info_payload_for_target
         )
@@ -323,8 +329,7 @@ class RelayHandler(StreamRequestHandler):
     def _handle_packet_perm_request(self, data: dict):
         """Handles PERM_REQUEST from a controller, forwards to target."""
         if self.client_info.role != ROLE_CONTROLLER:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 403, "reason": "Only controllers can send PERM_REQUEST"},
             )
@@ -332,8 +337,7 @@ class RelayHandler(StreamRequestHandler):
 
         # First check if controller has valid session
         if not self.client_info.session_id or not self.client_info.peer_username:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 400, "reason": "Not in an active session"},
             )
@@ -356,8 +360,7 @@ class RelayHandler(StreamRequestHandler):
                 logger.warning(
                     f"[PERM_REQUEST_FAIL] Target {target_username} not found for controller {self.client_info.username}"
                 )
-                send_json(
-                    self.request,
+                self.client_info.send_json(
                     PacketType.ERROR,
                     {"code": 404, "reason": "Target peer disconnected"},
                 )
@@ -368,8 +371,7 @@ class RelayHandler(StreamRequestHandler):
                 logger.warning(
                     f"[PERM_REQUEST_FAIL] Session mismatch for target {target_username} and controller {self.client_info.username}"
                 )
-                send_json(
-                    self.request,
+                self.client_info.send_json(
                     PacketType.ERROR,
                     {"code": 400, "reason": "Session mismatch with target"},
                 )
@@ -378,7 +380,7 @@ class RelayHandler(StreamRequestHandler):
             # Add controller information and forward request
             data["controller_username"] = self.client_info.username
             try:
-                send_json(target_info.sock, PacketType.PERM_REQUEST, data)
+                target_info.send_json(PacketType.PERM_REQUEST, data)
                 logger.info(
                     f"[PERM_REQUEST_FWD] Forwarded perm request from {self.client_info.username} to {target_username}: {data}"
                 )
@@ -386,8 +388,7 @@ class RelayHandler(StreamRequestHandler):
                 logger.error(
                     f"[PERM_REQUEST_ERROR] Failed to send permission request to {target_username}: {e}"
                 )
-                send_json(
-                    self.request,
+                self.client_info.send_json(
                     PacketType.ERROR,
                     {"code": 404, "reason": "Target peer disconnected"},
                 )
@@ -397,15 +398,13 @@ class RelayHandler(StreamRequestHandler):
     def _handle_packet_perm_response(self, data: dict):
         """Handles PERM_RESPONSE from a target, forwards to controller."""
         if self.client_info.role != ROLE_TARGET:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 403, "reason": "Only targets can send PERM_RESPONSE"},
             )
             return
         if not self.client_info.session_id or not self.client_info.peer_username:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 400, "reason": "Not in an active session"},
             )
@@ -421,8 +420,7 @@ class RelayHandler(StreamRequestHandler):
             logger.warning(
                 f"[PERM_RESPONSE_REJECTED] Mismatched controller username from {self.client_info.username}. Expected {self.client_info.peer_username}, got {controller_username}"
             )
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 400, "reason": "Invalid controller in response"},
             )
@@ -433,8 +431,7 @@ class RelayHandler(StreamRequestHandler):
             controller_info = self.server.active_clients.get(controller_username)
 
         if not controller_info:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 404, "reason": "Controller peer disconnected"},
             )
@@ -445,8 +442,7 @@ class RelayHandler(StreamRequestHandler):
             granted_perms  # Store on controller's info
         )
 
-        send_json(
-            controller_info.sock,
+        controller_info.send_json(
             PacketType.PERM_RESPONSE,
             {"granted": granted_perms, "target_username": self.client_info.username},
         )
@@ -468,8 +464,7 @@ class RelayHandler(StreamRequestHandler):
     def _handle_packet_chat(self, data: dict):
         """Handles CHAT messages, forwards to peer in session."""
         if not self.client_info.session_id or not self.client_info.peer_username:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 400, "reason": "Not in an active session for chat"},
             )
@@ -497,7 +492,7 @@ class RelayHandler(StreamRequestHandler):
                 "timestamp": timestamp,
                 "sender": sender_username,
             }
-            send_json(peer_info.sock, PacketType.CHAT, chat_payload)
+            peer_info.send_json(PacketType.CHAT, chat_payload)
         else:
             logger.warning(
                 f"[CHAT_FAIL] Peer {self.client_info.peer_username} not found or not in same session for chat from {sender_username}."
@@ -524,11 +519,7 @@ class RelayHandler(StreamRequestHandler):
 
         if controller_info and controller_info.granted_permissions.get("view"):
             try:
-                from shared.protocol import (
-                    send_bytes as send_raw_bytes,  # Explicit import if needed
-                )
-
-                send_raw_bytes(controller_info.sock, PacketType.FRAME, data)
+                controller_info.send_bytes(PacketType.FRAME, data)
 
             except Exception as e:
                 logger.error(
@@ -574,14 +565,16 @@ class RelayHandler(StreamRequestHandler):
             target_info = self.server.active_clients.get(target_username)
 
         if target_info:
-            send_json(
-                target_info.sock, PacketType.INPUT, data
-            )  # Forward the input data
+            target_info.send_json(PacketType.INPUT, data)  # Forward the input data
         else:
             logger.warning(
                 f"[INPUT_FAIL] Target {target_username} not found for input from {self.client_info.username}."
             )
 
+    def _handle_packet_heartbeat(self, data: dict):
+        """Echoes HEARTBEAT back to the sender so it can measure round-trip time."""
+        self.client_info.send_json(PacketType.HEARTBEAT, data)
+
     def _handle_packet_disconnect(self, data: dict):
         """Handles DISCONNECT packet from a client."""
         logger.info(
@@ -597,8 +590,7 @@ class RelayHandler(StreamRequestHandler):
             f"[UNKNOWN_PACKET] Received unknown packet type {pkt_type} from {self.client_info.username if self.client_info else 'N/A'}: {data}"
         )
         if self.client_info:
-            send_json(
-                self.request,
+            self.client_info.send_json(
                 PacketType.ERROR,
                 {"code": 400, "reason": f"Unknown packet type {pkt_type}"},
             )
@@ -631,8 +623,7 @@ class RelayHandler(StreamRequestHandler):
                         )
                         try:
                             # Send a specific "peer disconnected" message or just ERROR
-                            send_json(
-                                peer_info.sock,
+                            peer_info.send_json(
                                 PacketType.ERROR,
                                 {
                                     "code": 410,  # Gone
@@ -712,8 +703,7 @@ def main():
                 logger.info(f"Closing connection for {username}...")
                 try:
                     # Optionally send a "server shutting down" message
-                    send_json(
-                        client_conn.sock,
+                    client_conn.send_json(
                         PacketType.ERROR,
                         {"code": 503, "reason": "Server is shutting down"},
                     )
@@ -78,6 +78,20 @@ class PacketType(IntEnum):
 HEADER_STRUCT = struct.Struct("!I")  # 4-byte length prefix
 MAX_PACKET_SIZE = 100 * 1024 * 1024  # 100 MB max packet
 
+# Modifier bit flags carried in the "mods" field of INPUT events
+MOD_SHIFT = 0x1
+MOD_CTRL = 0x2
+MOD_ALT = 0x4
+MOD_META = 0x8
+
+# "wheel" INPUT events carry raw Qt angle deltas; one standard notch is
+# 15 degrees in 1/8 degree units.
+WHEEL_DELTA = 120
+
+# Compact separators: INPUT packets are small and frequent, so the default
+# ", " / ": " padding is a noticeable share of every payload.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 # Image processing options
 JPEG_OPTS = {
     "format": "JPEG",
@@ -86,6 +100,20 @@ JPEG_OPTS = {
 }
 
 
+def wheel_steps(residual: int, delta: int) -> Tuple[int, int]:
+    """Whole notches in ``residual + delta`` and the remainder to carry.
+
+    High-resolution wheels and touchpads report fractions of a notch. A
+    delta against the carried direction drops the remainder first, so
+    reversing the wheel is not swallowed by what was left of the old one.
+    """
+    if residual and delta and (residual > 0) != (delta > 0):
+        residual = 0
+    total = residual + delta
+    steps = int(total / WHEEL_DELTA)
+    return steps, total - steps * WHEEL_DELTA
+
+
 def send_json(sock: socket.socket, ptype: PacketType, data: Dict[str, Any]) -> None:
     """Send JSON message with packet type.
 
@@ -98,7 +126,7 @@ def send_json(sock: socket.socket, ptype: PacketType, data: Dict[str, Any]) -> N
         socket.error: On network errors
         ValueError: If packet exceeds MAX_PACKET_SIZE
     """
-    payload = json.dumps({"type": int(ptype), "data": data}).encode()
+    payload = _JSON_ENCODER.encode({"type": int(ptype), "data": data}).encode()
     if len(payload) > MAX_PACKET_SIZE:
         raise ValueError("Packet too large")
     sock.sendall(HEADER_STRUCT.pack(len(payload)) + payload)
@@ -0,0 +1,18 @@
+# File: shared/utils.py
+
+import time
+
+# Per-second memo for the local "HH:MM:SS" chat timestamp.
+_clock_cache = (-1, "")
+
+
+def clock_hms() -> str:
+    """Local wall-clock time as ``HH:MM:SS``, formatted at most once a second."""
+    global _clock_cache
+    now = int(time.time())
+    cached = _clock_cache
+    if now != cached[0]:
+        lt = time.localtime(now)
+        cached = (now, f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}")
+        _clock_cache = cached
+    return cached[1]